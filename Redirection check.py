@@ -1,90 +1,66 @@
-import pandas as pd
-import requests
-from requests.auth import HTTPBasicAuth
-from concurrent.futures import ThreadPoolExecutor, as_completed
+"""
+Standalone redirect (301) check, the same as the hub's Redirect Checker:
 
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    python "Redirection check.py" 301.xlsx 301_result.xlsx
 
-#from sqlalchemy import false
+Rows are written in input order while the run goes on.
+"""
+import os
+import sys
+import threading
 
-# === Configuration ===
-file_path = r'C:\Users\nayakaj\PythonCode\301.xlsx'
-output_path = r'C:\Users\nayakaj\PythonCode\301_result.xlsx'
-username = 'broadridgedigital'
-password = 'broadridge1'
-max_workers = 10   # adjust between 5–20 for performance vs. server tolerance
-timeout = 10       # seconds per request
-
-# === Read Excel ===
-df = pd.read_excel(file_path)
-df.columns = df.columns.str.strip()
-print("Columns found:", df.columns.tolist())
-
-url_col = 'URLs'  # Adjust to match your Excel header
-
-
-# === Redirect checking function ===
-def get_redirect_info(url):
-    try:
-        print(f"Checking: {url}")
-
-        # Step 1 - Check if redirect is set (without following redirects)
-        response = requests.get(url, allow_redirects=False, timeout=timeout, verify=False)
-        # Try again with credentials if needed
-        if response.status_code in [401, 403]:
-            response = requests.get(
-                url,
-                auth=HTTPBasicAuth(username, password),
-                allow_redirects=False,
-                timeout=timeout,
-                verify=False
-            )
-
-        redirect_type = response.status_code
-        redirected_url = response.headers.get("Location", None)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-        # Step 2 - If redirected, check the final target status
-        final_status = None
-        if redirected_url:
-            try:
-                final_response = requests.get(
-                    redirected_url, allow_redirects=True, timeout=timeout,verify=False
-                )
-                final_status = final_response.status_code
-            except requests.exceptions.RequestException as e:
-                final_status = f"Error: {e}"
+from modules.redirects import logic
 
-        # Return summary
-        return {
-            "URLs": url,
-            "Redirected URL": redirected_url if redirected_url else "No Redirect",
-            "Redirect Type": redirect_type,
-            "Final Status Code": final_status if final_status else redirect_type,
-        }
-
-    except requests.exceptions.RequestException as e:
-        return {
-            "URLs": url,
-            "Redirected URL": f"Error: {e}",
-            "Redirect Type": None,
-            "Final Status Code": None,
-        }
-
-
-# === Run concurrently with ThreadPoolExecutor ===
-results = []
-with ThreadPoolExecutor(max_workers=max_workers) as executor:
-    # Start all URL checks
-    future_to_url = {executor.submit(get_redirect_info, url): url for url in df[url_col]}
-
-    # Iterate as each completes
-    for future in as_completed(future_to_url):
-        result = future.result()
-        results.append(result)
-
-# === Convert results to DataFrame and save ===
-results_df = pd.DataFrame(results)
-results_df.to_excel(output_path, index=False, engine="openpyxl")
-
-print(f"\n✅ URL scanning complete. Results saved to: {output_path}")
\ No newline at end of file
+# === Configuration ===
+file_path = '301.xlsx'
+output_path = '301_result.xlsx'
+url_col = logic.URL_COLUMN   # Adjust to match your Excel header
+username = logic.USERNAME
+password = logic.PASSWORD
+auth_mode = logic.AUTH_MODE   # "challenge" (on 401/403), "always" or "never"
+max_workers = logic.BULK_CONCURRENCY   # URLs checked at once, also against a single host
+timeout = logic.TIMEOUT       # seconds per request
+
+
+class PrintProgress:
+    """Progress bus (see modules.progress) that prints each finished URL."""
+
+    def __init__(self):
+        self._lock = threading.Lock()   # rows finish on worker threads
+
+    def emit(self, event, **data):
+        with self._lock:
+            self._print(event, data)
+
+    def _print(self, event, data):
+        if event == "run_started":
+            print(f"Checking {data['total']} URLs...")
+        elif event == "row_finished":
+            print(f"Checked {data['row']}: {data['url']} -> {data['result']}")
+        elif event == "run_failed":
+            print(data["error"])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    input_file = argv[0] if len(argv) > 0 else file_path
+    output_file = argv[1] if len(argv) > 1 else output_path
+
+    saved = logic.run_redirect_audit(
+        input_file,
+        output_file,
+        max_workers,
+        url_col,
+        progress=PrintProgress(),
+        auth_mode=auth_mode,
+        username=username,
+        password=password,
+        timeout=timeout,
+    )
+    print(f"\n✅ URL scanning complete. {saved} rows saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 import requests
 import matplotlib.pyplot as plt
-from bs4 import BeautifulSoup
+from modules.parsing import make_soup
 from wordcloud import WordCloud
 import streamlit as st
 import pandas as pd
@@ -61,7 +61,7 @@ def fetch_duckduckgo_news(brand, limit=5):
         articles = []
         try:
             resp = requests.get(url, headers=headers, timeout=10, verify=certifi.where())
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = make_soup(resp.text)
             results = soup.find_all("a", class_="result__a")
             for i, result in enumerate(results[:limit]):
                 text = result.get_text(strip=True)
@@ -83,7 +83,7 @@ def fetch_youtube_titles(brand, limit=5):
             headers = {"User-Agent": "Mozilla/5.0"}
             url = f"https://duckduckgo.com/html/?q=site:youtube.com+{brand}"
             resp = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = make_soup(resp.text)
             results = soup.find_all("a", class_="result__a")
             for i, res in enumerate(results[:limit]):
                 text = res.get_text(strip=True)
@@ -105,7 +105,7 @@ def fetch_twitter_titles(brand, limit=5):
             headers = {"User-Agent": "Mozilla/5.0"}
             url = f"https://duckduckgo.com/html/?q=site:twitter.com+{brand}"
             resp = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = make_soup(resp.text)
             results = soup.find_all("a", class_="result__a")
             for i, res in enumerate(results[:limit]):
                 text = res.get_text(strip=True)
@@ -127,7 +127,7 @@ def fetch_glassdoor_reviews(brand, limit=5):
             headers = {"User-Agent": "Mozilla/5.0"}
             url = f"https://duckduckgo.com/html/?q=site:glassdoor.com+{brand}+reviews"
             resp = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = make_soup(resp.text)
             results = soup.find_all("a", class_="result__a")
             for i, res in enumerate(results[:limit]):
                 text = res.get_text(strip=True)
@@ -1,13 +1,7 @@
 import streamlit as st
 import asyncio
-import threading
-import time
 import sys
-from io import StringIO
 import os
-import re
-import pandas as pd
-import traceback
 
 # --- Windows asyncio fix ---
 if sys.platform.startswith("win"):
@@ -15,6 +9,8 @@ if sys.platform.startswith("win"):
 
 # === import your existing working script ===
 import form_automation
+from modules.job_view import show_job
+from modules.jobs import get_job_manager, job_workspace
 
 # --- Page setup ---
 st.set_page_config(page_title="Automated Form Tester", layout="wide")
@@ -29,23 +25,10 @@ st.markdown("""
 
 st.title("🌐 Automated Tracking link Form Tester")
 
-# ✅ Regex patterns (REQUIRED)
-row_pattern = re.compile(r"Row\s+(\d+)\s*->\s*(\S+)")
-finish_pattern = re.compile(r"✅ Results saved", re.IGNORECASE)
-
-# ✅ Thread helper (REQUIRED)
-def run_async_main(log_stream):
-    sys.stdout = log_stream
-    sys.stderr = log_stream
-    try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(form_automation.main())
-    except Exception:
-        traceback.print_exc()
-    finally:
-        sys.stdout = sys.__stdout__
-        sys.stderr = sys.__stderr__
+# ✅ Runs are submitted as background jobs; each browser session only keeps
+# its job ID, so concurrent users never share input/output paths or logins.
+MANUAL_JOB_KEY = "manual_job"
+BULK_JOB_KEY = "bulk_job"
 
 
 tab1, tab2 = st.tabs(["🔁 Manual File Path Mode", "📂 Bulk Upload Mode"])
@@ -64,76 +47,32 @@ with tab1:
         dev_password = st.text_input("DEV Password", type="password", value=form_automation.DEV_PASSWORD)
         input_file = st.text_input("Input Excel file path", value=form_automation.INPUT_FILE)
         output_file = st.text_input("Output Excel file path", value=form_automation.OUTPUT_FILE)
+        concurrency = st.number_input("Parallel browser contexts", min_value=1, max_value=16, value=form_automation.CONCURRENCY)
+        browsers = st.number_input("Browsers", min_value=1, max_value=4, value=form_automation.BROWSERS)
+        resume = st.checkbox("Resume previous run (skip rows with results)", value=form_automation.RESUME)
         headless = st.checkbox("Run headless browser", value=True)
         show_all_logs = st.checkbox("Show full logs", value=True)
         run_btn = st.button("🚀 Run Automation")
 
-    # Apply runtime config
-    form_automation.DEV_USERNAME = dev_username
-    form_automation.DEV_PASSWORD = dev_password
-    form_automation.INPUT_FILE = input_file
-    form_automation.OUTPUT_FILE = output_file
-
-    status_box = st.empty()
-    progress_box = st.empty()
-    table_box = st.empty()
-    log_box = st.empty()
-
     if run_btn:
 
         if not os.path.exists(input_file):
             st.error(f"❌ Input file not found: {input_file}")
             st.stop()
 
-        start_time = time.time()
-        status_box.info("Starting automation...")
-        log_stream = StringIO()
-
-        thread = threading.Thread(target=run_async_main, args=(log_stream,), daemon=True)
-        thread.start()
-
-        df = pd.DataFrame(columns=["Row", "URL", "Status"])
-
-        while thread.is_alive():
-            time.sleep(1)
-            logs = log_stream.getvalue()
-
-            if not show_all_logs:
-                logs = "\n".join(logs.splitlines()[-100:])
-
-            log_box.markdown(f"")
-
-            for row, url in row_pattern.findall(logs):
-                row_i = int(row)
-                if row_i not in df["Row"].values:
-                    df.loc[len(df)] = [row_i, url, "Running"]
-
-            for i in range(len(df)):
-                if f"Row {df.loc[i, 'Row']} ->" in logs and "Captured Response URL" in logs:
-                    df.at[i, "Status"] = "Done"
-
-            table_box.dataframe(df, use_container_width=True)
-
-            if len(df) > 0:
-                progress_box.progress(min(len(df)/max(1, df["Row"].max()), 1.0))
-
-            status_box.info(f"Processing... {len(df)} URLs so far")
+        st.session_state[MANUAL_JOB_KEY] = get_job_manager().submit(
+            "Form Tester",
+            form_automation.logic.main,
+            input_file=input_file,
+            output_file=output_file,
+            concurrency=int(concurrency),
+            browsers=int(browsers),
+            resume=resume,
+            username=dev_username,
+            password=dev_password,
+        )
 
-        thread.join(timeout=2)
-
-        elapsed = round(time.time() - start_time, 1)
-        final_logs = log_stream.getvalue()
-
-        st.text_area("📝 Final Logs", final_logs, height=400)
-        status_box.success(f"✅ Completed in {elapsed}s! Results saved at: {output_file}")
-
-        if os.path.exists(output_file):
-            with open(output_file, "rb") as f:
-                st.download_button(
-                    "⬇️ Download Results (Excel)",
-                    f,
-                    file_name=os.path.basename(output_file),
-                )
+    show_job(MANUAL_JOB_KEY, show_all_logs)
 
 
 # =====================================================
@@ -158,39 +97,25 @@ with tab2:
             st.error("❌ Please upload an Excel file first.")
             st.stop()
 
-        temp_input_path = os.path.join(os.getcwd(), "temp_uploaded_input.xlsx")
+        # ✅ every upload gets its own folder, so parallel runs can't clobber each other
+        workspace = job_workspace()
+        temp_input_path = os.path.join(workspace, "input.xlsx")
         with open(temp_input_path, "wb") as f:
             f.write(uploaded_file.read())
 
-        temp_output_path = os.path.join(os.getcwd(), "temp_bulk_output.xlsx")
-
-        # ✅ FIXED TYPO HERE
-        form_automation.INPUT_FILE = temp_input_path
-        form_automation.OUTPUT_FILE = temp_output_path
-
-        status_box2 = st.empty()
-        log_box2 = st.empty()
-
-        status_box2.info("Starting bulk automation...")
-
-        log_stream = StringIO()
-
-        thread = threading.Thread(target=run_async_main, args=(log_stream,), daemon=True)
-        thread.start()
-
-        while thread.is_alive():
-            time.sleep(1)
-            logs = log_stream.getvalue()
-            log_box2.markdown(f"")
-
-        thread.join(timeout=2)
-
-        status_box2.success("✅ Bulk automation completed!")
-
-        if os.path.exists(temp_output_path):
-            with open(temp_output_path, "rb") as f:
-                st.download_button(
-                    "⬇️ Download Bulk Results",
-                    f,
-                    file_name="bulk_results.xlsx",
-                )
+        temp_output_path = os.path.join(workspace, "output.xlsx")
+
+        st.session_state[BULK_JOB_KEY] = get_job_manager().submit(
+            "Form Tester",
+            form_automation.logic.main,
+            workspace=workspace,
+            input_file=temp_input_path,
+            output_file=temp_output_path,
+            concurrency=int(concurrency),
+            browsers=int(browsers),
+            resume=False,
+            username=dev_username,
+            password=dev_password,
+        )
+
+    show_job(BULK_JOB_KEY, show_logs=False, download_name="bulk_results.xlsx")
@@ -0,0 +1,272 @@
+"""
+Headless command-line runner for the automation modules.
+
+    python bau.py list
+    python bau.py run seo-meta --input urls.xlsx --concurrency 8 --out results.parquet
+    python bau.py run link-audit --crawl https://www.example.com --max-depth 2 --out audit.csv
+    python bau.py run form-tester --input input.xlsx --out output.xlsx --resume
+    python bau.py run redirects --input 301.xlsx --concurrency 16 --out 301_result.xlsx
+
+Each command imports only the logic module it drives (never Streamlit),
+so it starts quickly and can be scheduled from cron. Results go to --out
+(.xlsx, .csv, .jsonl or .parquet) or, without --out, to stdout as JSON
+lines.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Make `modules` importable when the script is started from anywhere
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+if sys.platform.startswith("win"):
+    import asyncio
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+
+# -------------------------
+# Helpers
+# -------------------------
+
+def read_urls(path):
+    """URLs from the "URL" column of an .xlsx/.csv file, or one per line of a text file."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in (".xlsx", ".xls", ".csv"):
+        with open(path, encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+    import pandas as pd
+    df_in = pd.read_csv(path) if ext == ".csv" else pd.read_excel(path)
+    if "URL" not in df_in.columns:
+        raise SystemExit(f"❌ {path} must contain a column named 'URL'")
+    return [str(u).strip() for u in df_in["URL"].dropna() if str(u).strip()]
+
+
+def write_output(rows, out, columns=None):
+    """Write row dicts to `out`, or to stdout as JSON lines; returns the row count."""
+    if out:
+        from modules.results_sink import write_rows
+        return write_rows(rows, out, columns)
+
+    count = 0
+    for row in rows:
+        print(json.dumps(row, ensure_ascii=False, default=str), flush=True)
+        count += 1
+    return count
+
+
+def use_page_budget(concurrency):
+    from modules.browser_pool import get_pool
+    pool = get_pool()
+    if pool.max_pages < concurrency:
+        pool.set_max_pages(concurrency)
+
+
+# -------------------------
+# Commands
+# -------------------------
+
+def run_seo_meta(args):
+    from modules.seo_meta import logic
+
+    wait_until = args.wait_until or logic.WAIT_UNTIL
+    rows = logic.iter_bulk(read_urls(args.input), args.concurrency or logic.BULK_CONCURRENCY, wait_until,
+                           engine=args.engine or logic.ENGINE)
+    return write_output(rows, args.out)
+
+
+def use_badge_patterns(args):
+    if args.badge_patterns:
+        from modules.badge_caps.logic import load_badge_patterns, set_badge_patterns
+        set_badge_patterns(load_badge_patterns(args.badge_patterns))
+
+
+def run_badge_caps(args):
+    from modules.badge_caps import logic
+
+    use_badge_patterns(args)
+    rows = logic.iter_badge_caps_bulk(
+        read_urls(args.input), args.engine or logic.ENGINE, args.concurrency or logic.BULK_CONCURRENCY,
+        args.url_timeout or logic.URL_TIMEOUT
+    )
+    return write_output(rows, args.out)
+
+
+def run_dummy_links(args):
+    from modules.dummy_links import logic
+
+    concurrency = args.concurrency or logic.BULK_CONCURRENCY
+    pages = logic.iter_dummy_links_pages(read_urls(args.input), concurrency, args.engine or logic.ENGINE)
+    if not args.counts_out:
+        return write_output(logic.iter_dummy_link_rows(pages), args.out, logic.LINK_COLUMNS)
+
+    from modules.results_sink import open_sink
+    with open_sink(args.counts_out, logic.COUNT_COLUMNS) as counts:
+        rows = logic.iter_dummy_link_rows(pages, counts.write)
+        return write_output(rows, args.out, logic.LINK_COLUMNS)
+
+
+def run_link_audit(args):
+    from modules.link_audit import logic
+
+    concurrency = args.concurrency or logic.PAGES_IN_FLIGHT
+    use_page_budget(concurrency)
+    if args.crawl:
+        records = logic.iter_crawl_site(
+            args.crawl, args.max_depth, args.max_pages, concurrency
+        )
+    elif args.input:
+        records = logic.iter_audit_pages(read_urls(args.input), concurrency)
+    else:
+        raise SystemExit("❌ link-audit needs --input or --crawl")
+
+    return write_output(logic.iter_audit_rows(records), args.out, logic.AUDIT_COLUMNS)
+
+
+def run_form_tester(args):
+    import asyncio
+    from modules.form_tester import logic
+
+    if not args.out or not args.out.lower().endswith(".xlsx"):
+        raise SystemExit("❌ form-tester writes a workbook: pass --out results.xlsx")
+
+    asyncio.run(logic.main(
+        input_file=args.input,
+        output_file=args.out,
+        concurrency=args.concurrency or logic.CONCURRENCY,
+        browsers=args.browsers,
+        resume=args.resume,
+        username=args.username,
+        password=args.password,
+    ))
+    return None
+
+
+def run_redirects(args):
+    from modules.redirects import logic
+
+    if os.path.splitext(args.input)[1].lower() in (".xlsx", ".xls", ".csv"):
+        urls, error = logic.read_url_list(args.input, args.url_column or logic.URL_COLUMN)
+        if error:
+            raise SystemExit(f"❌ {error}")
+    else:
+        urls = read_urls(args.input)
+
+    options = {"auth_mode": args.auth_mode, "head_first": not args.no_head}
+    if args.username and args.password:
+        options.update(username=args.username, password=args.password)
+    rows = logic.iter_redirects(urls, args.concurrency or logic.BULK_CONCURRENCY, **options)
+    return write_output(rows, args.out, logic.COLUMNS)
+
+
+def run_smart_runner(args):
+    from modules.smart_runner import logic
+
+    selected = [name.strip() for name in args.use_cases.split(",") if name.strip()]
+    if "Badge Caps" in selected:
+        use_badge_patterns(args)
+    summaries = logic.iter_bulk_summaries(
+        read_urls(args.input), selected, args.concurrency or logic.PAGES_IN_FLIGHT,
+        args.http_concurrency or logic.HTTP_IN_FLIGHT,
+    )
+    return write_output(summaries, args.out, ["URL"] + selected)
+
+
+COMMANDS = {
+    "seo-meta": (run_seo_meta, "Meta title/description/robots and missing image ALT text"),
+    "badge-caps": (run_badge_caps, "Badge text casing against the allowed badge patterns"),
+    "dummy-links": (run_dummy_links, "Placeholder links (#..., javascript:void(0), empty href)"),
+    "link-audit": (run_link_audit, "Link health and target behaviour for pages or a crawl"),
+    "form-tester": (run_form_tester, "Tracking-link form submissions (workbook in, workbook out)"),
+    "redirects": (run_redirects, "Redirect chains (301 validation) for a URL list"),
+    "smart-runner": (run_smart_runner, "Several use cases per URL, one summary row each"),
+}
+
+
+# -------------------------
+# Entry point
+# -------------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="bau", description="Run BAU automations without the UI.")
+    sub = parser.add_subparsers(dest="action", required=True)
+
+    sub.add_parser("list", help="List the available modules")
+
+    run = sub.add_parser("run", help="Run one module")
+    run.add_argument("module", choices=sorted(COMMANDS))
+    run.add_argument("--input", "-i", help="URL list (.xlsx/.csv with a URL column, or .txt)")
+    run.add_argument("--out", "-o", help="Output file (.xlsx/.csv/.jsonl/.parquet); stdout JSON lines if omitted")
+    run.add_argument("--concurrency", "-c", type=int,
+                     help="Pages/URLs processed at once (default: the module's own, e.g. 8 for seo-meta, "
+                          "16 for dummy-links and redirects)")
+
+    seo = run.add_argument_group("seo-meta / badge-caps / dummy-links")
+    seo.add_argument("--engine", choices=["auto", "static", "browser"],
+                     help="static: raw HTML only; browser: always render; auto: render when raw HTML looks incomplete "
+                          "(dummy-links: fewer than 5 links). Default: auto, browser for badge-caps")
+    seo.add_argument("--wait-until", choices=["domcontentloaded", "load", "networkidle", "commit"],
+                     help="Navigation event to wait for (default: domcontentloaded)")
+    seo.add_argument("--url-timeout", type=float,
+                     help="badge-caps: seconds one rendered URL may take (default: 90)")
+    seo.add_argument("--badge-patterns", default=os.getenv("BAU_BADGE_PATTERNS"),
+                     help="JSON file with the allowed badge patterns (badge-caps, smart-runner)")
+
+    dummy = run.add_argument_group("dummy-links")
+    dummy.add_argument("--counts-out", help="Also write one dummy-link count per URL to this file")
+
+    crawl = run.add_argument_group("link-audit")
+    crawl.add_argument("--crawl", help="Start URL to crawl instead of --input")
+    crawl.add_argument("--max-depth", type=int, default=2)
+    crawl.add_argument("--max-pages", type=int, default=200)
+
+    form = run.add_argument_group("form-tester")
+    form.add_argument("--browsers", type=int, default=1)
+    form.add_argument("--resume", action="store_true", help="Continue a previous run from --out")
+    form.add_argument("--username", default=os.getenv("DEV_USERNAME"))
+    form.add_argument("--password", default=os.getenv("DEV_PASSWORD"))
+
+    redirects = run.add_argument_group("redirects (also uses --username/--password)")
+    redirects.add_argument("--url-column", help="URL column of an .xlsx/.csv input (default: URLs)")
+    redirects.add_argument("--auth-mode", choices=["challenge", "always", "never"], default="challenge",
+                           help="When to send credentials (challenge: after a 401/403)")
+    redirects.add_argument("--no-head", action="store_true", help="Probe with GET instead of HEAD")
+
+    smart = run.add_argument_group("smart-runner")
+    smart.add_argument("--use-cases", default="Badge Caps,Dummy Links,Link Audit,SEO Meta",
+                       help="Comma-separated use cases")
+    smart.add_argument("--http-concurrency", type=int, help="HTTP checks in flight (default: 32)")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.action == "list":
+        for name, (_, description) in sorted(COMMANDS.items()):
+            print(f"{name:<14} {description}")
+        return 0
+
+    if args.module != "link-audit" and not args.input:
+        raise SystemExit(f"❌ {args.module} needs --input")
+    if args.input and not os.path.exists(args.input):
+        raise SystemExit(f"❌ Input file not found: {args.input}")
+
+    started = time.time()
+    handler, _ = COMMANDS[args.module]
+    count = handler(args)
+
+    elapsed = round(time.time() - started, 1)
+    target = args.out or "stdout"
+    if count is None:
+        print(f"✅ {args.module} finished in {elapsed}s -> {target}", file=sys.stderr)
+    else:
+        print(f"✅ {args.module}: {count} rows in {elapsed}s -> {target}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+HTML parser benchmark for the page checks.
+
+Parses each page with every installed BeautifulSoup tree builder, prints
+the best time per parser, and verifies that the SEO meta, badge and dummy
+link checks give the same result whichever parser built the tree.
+
+    python benchmarks/parse_benchmark.py saved_pages/*.html
+    python benchmarks/parse_benchmark.py --repeat 10
+
+Without arguments a ~1.5 MB synthetic page (many cards, badges and links)
+is used. Run it from the repository root.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from modules.parsing import PREFERRED_PARSERS, _available, make_soup  # noqa: E402
+
+
+# -------------------------
+# Input pages
+# -------------------------
+
+CARD = """
+<div class="card">
+  <span class="badge badge-light" slot="title">{badge}</span>
+  <h3><a href="/resources/item-{i}">Resource item {i}</a></h3>
+  <img src="/img/{i}.png" {alt}>
+  <p>Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod
+  tempor incididunt ut labore et dolore magna aliqua &amp; more.</p>
+  <a href="{href}">Read more</a>
+</div>
+"""
+
+
+def synthetic_page(cards=4000):
+    """About 1.5 MB of markup shaped like a listing page."""
+    body = "".join(
+        CARD.format(
+            i=i,
+            badge="WEBINAR" if i % 3 else "Webinar",
+            alt='alt="Card image"' if i % 4 else "",
+            href="#" if i % 7 == 0 else f"/resources/item-{i}",
+        )
+        for i in range(cards)
+    )
+    return (
+        "<!DOCTYPE html><html><head>"
+        '<meta name="title" content="Benchmark page">'
+        '<meta name="description" content="Synthetic page for parser timing">'
+        '<meta name="googlebot" content="index, follow">'
+        f"</head><body>{body}</body></html>"
+    )
+
+
+def load_pages(patterns):
+    """[(label, markup)] for the given paths/globs, or the synthetic page."""
+    if not patterns:
+        return [("synthetic", synthetic_page())]
+
+    pages = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                pages.append((os.path.basename(path), f.read()))
+    return pages
+
+
+# -------------------------
+# Measurement
+# -------------------------
+
+def run_checks(soup):
+    """Results of every soup-based check, for comparing parsers."""
+    from modules.badge_caps.logic import find_badges
+    from modules.dummy_links.logic import find_dummy_links
+    from modules.seo_meta.logic import analyze_meta_tags
+
+    return {
+        "SEO Meta": analyze_meta_tags(soup, "bench"),
+        "Badge Caps": find_badges(soup, "bench"),
+        "Dummy Links": find_dummy_links(soup),
+    }
+
+
+def best_parse_ms(markup, parser, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        make_soup(markup, parser)
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="Saved HTML pages (paths or globs)")
+    parser.add_argument("--repeat", type=int, default=5, help="parses per page and parser (best is kept)")
+    args = parser.parse_args(argv)
+
+    parsers = [name for name in PREFERRED_PARSERS if _available(name)]
+    print(f"Parsers: {', '.join(parsers)}\n")
+
+    mismatches = 0
+    for label, markup in load_pages(args.pages):
+        size_kb = len(markup.encode("utf-8")) / 1024
+        timings = {name: best_parse_ms(markup, name, max(1, args.repeat)) for name in parsers}
+        results = {name: run_checks(make_soup(markup, name)) for name in parsers}
+
+        baseline = results[parsers[-1]]
+        differs = [
+            f"{check} ({name})"
+            for name in parsers[:-1]
+            for check in baseline
+            if results[name][check] != baseline[check]
+        ]
+        mismatches += bool(differs)
+
+        cells = "  ".join(f"{name} {ms:8.1f} ms" for name, ms in timings.items())
+        note = f"  ❌ differs: {', '.join(differs)}" if differs else "  ✅ same results"
+        print(f"{label:<28} {size_kb:8.0f} KB  {cells}{note}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
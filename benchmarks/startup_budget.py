@@ -0,0 +1,102 @@
+"""
+Import-time budget for the Automation Hub and the CLI.
+
+Runs each entry point in a fresh interpreter under `python -X importtime`
+and fails (exit code 1) when
+
+  * importing it takes longer than its budget (Streamlit itself is
+    imported first and not counted), or
+  * it pulls in a heavy library that should only load once a check runs.
+
+    python benchmarks/startup_budget.py
+    python benchmarks/startup_budget.py --budget-ms 250 --repeat 5
+
+Run it from the repository root (CI, before building the image).
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# -------------------------
+# Budget
+# -------------------------
+
+BUDGET_MS = 150     # cumulative import time allowed per entry point
+
+# Loaded only when a check actually runs, never at page/CLI start-up
+DEFERRED_MODULES = [
+    "pandas", "numpy", "pyarrow", "openpyxl",
+    "playwright", "bs4", "lxml", "requests",
+]
+
+# (label, modules imported first and not counted, module under test)
+ENTRY_POINTS = [
+    (f"hub: {name}", "streamlit", f"modules.{name}.ui")
+    for name in sorted(os.listdir(os.path.join(ROOT, "modules")))
+    if os.path.isfile(os.path.join(ROOT, "modules", name, "ui.py"))
+] + [
+    ("cli: bau", None, "bau"),
+]
+
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+# -------------------------
+# Measurement
+# -------------------------
+
+def measure(preload, target):
+    """(cumulative µs for `target`, top-level module names it imported)."""
+    code = f"import {preload}\nimport {target}" if preload else f"import {target}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{proc.stderr[-2000:]}")
+
+    lines = [LINE.match(l) for l in proc.stderr.splitlines()]
+    lines = [m for m in lines if m]
+
+    # importtime lists children before their parent; everything after the
+    # preload's own line belongs to the target
+    start = 0
+    if preload:
+        start = next(i for i, m in enumerate(lines) if m.group(4) == preload and len(m.group(3)) <= 1) + 1
+
+    cumulative = 0
+    loaded = set()
+    for m in lines[start:]:
+        loaded.add(m.group(4).split(".")[0])
+        if m.group(4) == target:
+            cumulative = int(m.group(2))
+    return cumulative, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per entry point (best is kept)")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for label, preload, target in ENTRY_POINTS:
+        runs = [measure(preload, target) for _ in range(max(1, args.repeat))]
+        best_ms = min(us for us, _ in runs) / 1000
+        heavy = sorted(set(DEFERRED_MODULES) & runs[0][1])
+
+        ok = best_ms <= args.budget_ms and not heavy
+        failures += not ok
+        note = f"  eager: {', '.join(heavy)}" if heavy else ""
+        print(f"{'✅' if ok else '❌'} {label:<24} {best_ms:8.1f} ms{note}")
+
+    print(f"\nBudget {args.budget_ms:.0f} ms per entry point: {'FAIL' if failures else 'OK'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
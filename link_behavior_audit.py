@@ -7,10 +7,13 @@ import io
 # ✅ Must be the first Streamlit call
 st.set_page_config(page_title="Link Behavior Audit", layout="wide")
 
-from bs4 import BeautifulSoup
+from modules.parsing import make_soup
 from openpyxl.styles import PatternFill
 from playwright.sync_api import sync_playwright
 
+from modules.link_audit.logic import classify_status
+from modules.link_cache import get_link_cache
+
 # -------------------------
 # Configuration
 # -------------------------
@@ -60,6 +63,11 @@ def extract_basic_auth(url: str):
 
 
 def check_link_status(url, timeout=10):
+    cache = get_link_cache()
+    cached = cache.get(url)
+    if cached is not None:
+        return cached
+
     try:
         response = requests.head(url, allow_redirects=True, timeout=timeout)
 
@@ -67,19 +75,15 @@ def check_link_status(url, timeout=10):
             response = requests.get(url, allow_redirects=True, timeout=timeout)
 
         code = response.status_code
+        link_health = classify_status(code)
 
-        if 200 <= code < 300:
-            return code, "OK"
-        elif 300 <= code < 400:
-            return code, "Redirect"
-        elif 400 <= code < 500:
-            return code, "Client Error"
-        elif 500 <= code < 600:
-            return code, "Server Error"
-        else:
-            return code, "Unknown"
+        # every hop of the redirect chain shares the final status
+        redirect_chain = [r.url for r in response.history] + [response.url]
+        cache.put(url, code, link_health, redirect_chain)
+        return code, link_health
 
     except Exception:
+        cache.put(url, "Error", "Unreachable")
         return "Error", "Unreachable"
 
 
@@ -116,7 +120,7 @@ def analyze_links(page_url, username="", password=""):
     except Exception as e:
         return [], f"Error fetching page: {e}"
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     for selector in IGNORE_SELECTORS:
         for tag in soup.select(selector):
@@ -3,7 +3,9 @@ import importlib
 import os
 
 import asyncio
-asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+import sys
+if sys.platform.startswith("win"):
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
 st.set_page_config(page_title="Automation Hub", layout="wide")
 
@@ -11,10 +13,12 @@ st.title("Automation Hub")
 
 MODULE_PATH = "modules"
 
-modules = [
+# Only list use cases (folders with a ui.py); a module's ui - and the heavy
+# libraries behind it - is imported only once it is selected.
+modules = sorted(
     m for m in os.listdir(MODULE_PATH)
-    if os.path.isdir(os.path.join(MODULE_PATH, m))
-]
+    if os.path.isfile(os.path.join(MODULE_PATH, m, "ui.py"))
+)
 
 selected = st.sidebar.selectbox("Select Use Case", modules)
 
@@ -1,11 +1,41 @@
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import json
+import os
 import re
 
+from modules.browser_pool import get_pool
+from modules.page_extract import extract_one
+from modules.results_sink import in_input_order
+from modules.static_page import ENGINES, fetch_soup, looks_unrendered
+
 # ---------- CONFIG ----------
 INPUT_FILE = r"C:\Users\nayakaj\PythonCode\input_url_list.xlsx"
 OUTPUT_FILE = r"C:\Users\nayakaj\PythonCode\badge_caps_validation.xlsx"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# "browser": render every page (badges are often added client-side, which
+# raw HTML can't show); "auto": raw HTML over HTTP, rendered only when the
+# HTML is an app shell; "static": raw HTML only. "auto" and "static" are
+# faster but miss badges injected by JS on server-rendered pages.
+ENGINE = "browser"
+
+# JSON file with the badge whitelist; replaces BADGE_PATTERNS when set
+# (see load_badge_patterns for the format)
+BADGE_PATTERNS_FILE = os.getenv("BAU_BADGE_PATTERNS", "")
+
+# Bulk runs
+BULK_CONCURRENCY = 8       # URLs checked at once (pages on the shared pool)
+URL_TIMEOUT = 90           # seconds one rendered URL may take before it is reported as an error
+PAGE_TIMEOUT_MS = 60000    # navigation timeout inside that budget
+SETTLE_MS = 500            # extra wait after networkidle for late badges
+
+COLUMNS = ["URL", "Badge Found", "Badge Text ALL CAPS", "Badge Text", "Badge Location", "Status"]
 # ----------------------------
 
 # WHITELIST OF ALLOWED BADGE PATTERNS
@@ -43,126 +73,276 @@ def is_all_caps(text):
     return all(ch.isupper() for ch in letters)
 
 
+# -------------------------
+# Pattern matcher
+# -------------------------
+# BADGE_PATTERNS are compiled once: a CSS selector list for the browser
+# (querySelectorAll visits only the badges), and frozen class sets / attr
+# tuples for BeautifulSoup, where each element's class set is built once.
+
+_matcher = None
+
+
+def load_badge_patterns(path):
+    """
+    Badge patterns from a JSON file: a list shaped like BADGE_PATTERNS,
+    with lists instead of sets, e.g.
+
+        [{"tag": "span", "required_classes": ["badge", "badge-dark"],
+          "required_attrs": {"slot": "title"}}]
+    """
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+
+    if not isinstance(raw, list):
+        raise ValueError(f"{path}: expected a JSON list of badge patterns")
+
+    patterns = []
+    for number, entry in enumerate(raw, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: pattern {number} is not an object")
+        patterns.append({
+            "tag": str(entry.get("tag", "span")).lower(),
+            "required_classes": set(entry.get("required_classes", [])),
+            "required_attrs": {str(k): str(v) for k, v in entry.get("required_attrs", {}).items()},
+        })
+    return patterns
+
+
+def set_badge_patterns(patterns):
+    """Replace the badge whitelist for this process and recompile it."""
+    global BADGE_PATTERNS, _matcher
+    BADGE_PATTERNS = patterns
+    _matcher = None
+    return badge_matcher()
+
+
+def _css_ident(name):
+    escaped = re.sub(r"([^A-Za-z0-9_-])", r"\\\1", name)
+    return re.sub(r"^(\d)", lambda m: f"\\3{m.group(1)} ", escaped)
+
+
+def pattern_selector(pattern):
+    """CSS selector for one pattern, e.g. span.badge.badge-light[slot="title"]."""
+    classes = "".join(f".{_css_ident(c)}" for c in sorted(pattern["required_classes"]))
+    attrs = "".join(
+        f"[{_css_ident(attr)}={json.dumps(value, ensure_ascii=False)}]"
+        for attr, value in sorted(pattern["required_attrs"].items())
+    )
+    return f"{pattern['tag']}{classes}{attrs}"
+
+
+def compile_badge_patterns(patterns):
+    return {
+        "selector": ", ".join(dict.fromkeys(pattern_selector(p) for p in patterns)),
+        "tags": sorted({p["tag"] for p in patterns}),
+        "patterns": [
+            (p["tag"], frozenset(p["required_classes"]), tuple(p["required_attrs"].items()))
+            for p in patterns
+        ],
+    }
+
+
+def badge_matcher():
+    """The compiled BADGE_PATTERNS (loaded from BADGE_PATTERNS_FILE if set)."""
+    global BADGE_PATTERNS, BADGE_PATTERNS_FILE, _matcher
+    if _matcher is None:
+        if BADGE_PATTERNS_FILE:
+            BADGE_PATTERNS = load_badge_patterns(BADGE_PATTERNS_FILE)
+            BADGE_PATTERNS_FILE = ""    # read once; set_badge_patterns() wins afterwards
+        _matcher = compile_badge_patterns(BADGE_PATTERNS)
+    return _matcher
+
+
 def matches_badge_pattern(element):
     """
     Strictly validates element against approved badge patterns
     """
-    for pattern in BADGE_PATTERNS:
-        if element.name != pattern["tag"]:
-            continue
+    classes = set(element.get("class", []))
 
-        classes = set(element.get("class", []))
-        if not pattern["required_classes"].issubset(classes):
+    for tag, required_classes, required_attrs in badge_matcher()["patterns"]:
+        if element.name != tag or not required_classes <= classes:
             continue
-
-        attrs_match = True
-        for attr, value in pattern["required_attrs"].items():
-            if element.get(attr) != value:
-                attrs_match = False
-                break
-
-        if attrs_match:
+        if all(element.get(attr) == value for attr, value in required_attrs):
             return True
 
     return False
 
 
-def check_badge_caps(page, url):
-    rows = []
-    status = "OK"
+# -------------------------
+# Extraction
+# -------------------------
+# Data the check needs: text, id and classes of every whitelisted badge.
 
-    try:
-        page.goto(url, timeout=60000, wait_until="networkidle")
-        page.wait_for_timeout(500)
+BADGE_JS = """
+(selector) => selector
+    ? [...document.querySelectorAll(selector)].map((el) => ({
+        text: strippedText(el),
+        id: el.getAttribute("id") || "",
+        classes: [...el.classList],
+    }))
+    : []
+"""
 
-        soup = BeautifulSoup(page.content(), "html.parser")
 
-        for element in soup.find_all("span"):
-            if not matches_badge_pattern(element):
-                continue
+def extract_badges(soup):
+    """The BADGE_JS data, read from a parsed page."""
+    tags = badge_matcher()["tags"]
+    return [
+        {
+            "text": element.get_text(strip=True),
+            "id": element.get("id") or "",
+            "classes": list(element.get("class", [])),
+        }
+        for element in (soup.find_all(tags) if tags else [])
+        if matches_badge_pattern(element)
+    ]
 
-            text = element.get_text(strip=True)
 
-            is_caps = "Y" if is_all_caps(text) else "N"
+def badge_extractor():
+    return {"js": BADGE_JS, "arg": badge_matcher()["selector"], "soup": extract_badges}
 
-            identifier = (
-                element.get("id")
-                or " ".join(element.get("class", []))
-                or "span"
-            )
 
-            location = f"<span class='{identifier}'>"
+def badges_from_data(badges, url):
+    """Badge rows for the extracted badges of one page."""
+    rows = []
+    status = "OK"
 
-            rows.append({
-                "URL": url,
-                "Badge Found": "Y",
-                "Badge Text ALL CAPS": is_caps,
-                "Badge Text": text,
-                "Badge Location": location,
-                "Status": status
-            })
+    for badge in badges:
+        text = badge["text"]
+
+        is_caps = "Y" if is_all_caps(text) else "N"
+
+        identifier = (
+            badge["id"]
+            or " ".join(badge["classes"])
+            or "span"
+        )
+
+        location = f"<span class='{identifier}'>"
 
-    except Exception as e:
         rows.append({
             "URL": url,
-            "Badge Found": "N",
-            "Badge Text ALL CAPS": "N",
-            "Badge Text": "",
-            "Badge Location": "",
-            "Status": f"Error: {e}"
+            "Badge Found": "Y",
+            "Badge Text ALL CAPS": is_caps,
+            "Badge Text": text,
+            "Badge Location": location,
+            "Status": status
         })
 
     return rows
 
-def run_badge_caps_for_url(url):
-    results = []
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
-        )
-        page = context.new_page()
+def find_badges(soup, url):
+    """Badge rows for every whitelisted badge span on an already-parsed page."""
+    return badges_from_data(extract_badges(soup), url)
+
+
+def badge_error_rows(url, error):
+    return [{
+        "URL": url,
+        "Badge Found": "N",
+        "Badge Text ALL CAPS": "N",
+        "Badge Text": "",
+        "Badge Location": "",
+        "Status": f"Error: {error}"
+    }]
+
+
+async def check_badge_caps(page, url):
+
+    try:
+        await page.goto(url, timeout=PAGE_TIMEOUT_MS, wait_until="networkidle")
+        await page.wait_for_timeout(SETTLE_MS)
+
+        return badges_from_data(await extract_one(page, badge_extractor()), url)
+
+    except Exception as e:
+        return badge_error_rows(url, e)
+
+
+async def check_badge_caps_within(page, url, url_timeout=URL_TIMEOUT):
+    """
+    check_badge_caps() with `url_timeout` applied once the page is leased,
+    so time spent waiting for a free pool page doesn't count.
+    """
+    try:
+        return await asyncio.wait_for(check_badge_caps(page, url), url_timeout)
+    except asyncio.TimeoutError:
+        return badge_error_rows(url, f"Timed out after {url_timeout}s")
+
 
-        badge_rows = check_badge_caps(page, url)
-        results.extend(badge_rows)
+def check_url(url, engine=ENGINE, url_timeout=URL_TIMEOUT):
+    """Badge rows for one URL with the chosen engine (see ENGINE)."""
+    if engine != "browser":
+        soup, error = fetch_soup(url, USER_AGENT)
+        if engine == "static":
+            return find_badges(soup, url) if soup is not None else badge_error_rows(url, error)
+        if not looks_unrendered(soup):
+            return find_badges(soup, url)
+
+    return get_pool().run(
+        check_badge_caps_within, url, url_timeout, context_options={"user_agent": USER_AGENT}
+    )
+
+
+def run_badge_caps_for_url(url, engine=ENGINE):
+    results = []
 
-        browser.close()
+    badge_rows = check_url(url, engine)
+    results.extend(badge_rows)
 
     return results
 
 
-def run_badge_caps_bulk(file):
+def read_url_list(file):
+    """URLs from the "URL" column of an uploaded Excel file."""
+    import pandas as pd
+
     df_in = pd.read_excel(file)
 
     if "URL" not in df_in.columns:
         return None, "Excel must contain a column named 'URL'"
 
-    results = []
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
-        )
-        page = context.new_page()
-
-        for url in df_in["URL"].dropna():
-            url = str(url).strip()
-            badge_rows = check_badge_caps(page, url)
-            results.extend(badge_rows)
+    return [str(url).strip() for url in df_in["URL"].dropna()], None
 
-        browser.close()
 
-    return pd.DataFrame(results), None
-    #pd.DataFrame(results).to_excel(output_file, index=False)
+def iter_badge_caps_pages(urls, engine=ENGINE, concurrency=BULK_CONCURRENCY, url_timeout=URL_TIMEOUT):
+    """
+    Check up to `concurrency` URLs at once on the shared browser pool,
+    yielding (index, url, rows) as each URL finishes. A URL that takes
+    longer than `url_timeout` seconds to render (not counting the wait for
+    a free page) gets an error row.
+    """
+    pool = get_pool()
+    concurrency = max(1, int(concurrency))
+    if pool.max_pages < concurrency:
+        pool.set_max_pages(concurrency)
 
-    #return f"✅ Done! Results saved to: {output_file}"
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = {
+            executor.submit(check_url, url, engine, url_timeout): (i, url)
+            for i, url in enumerate(urls)
+        }
+        for future in as_completed(futures):
+            i, url = futures[future]
+            try:
+                rows = future.result()
+            except Exception as e:
+                rows = badge_error_rows(url, e)
+            yield i, url, rows
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_badge_caps_ordered(urls, engine=ENGINE, concurrency=BULK_CONCURRENCY, url_timeout=URL_TIMEOUT):
+    """(url, rows) for every URL in input order, each as soon as it is due."""
+    pages = iter_badge_caps_pages(urls, engine, concurrency, url_timeout)
+    return in_input_order((i, (url, rows)) for i, url, rows in pages)
+
+
+def iter_badge_caps_bulk(urls, engine=ENGINE, concurrency=BULK_CONCURRENCY, url_timeout=URL_TIMEOUT):
+    """Badge rows for every URL in input order, each URL's rows as soon as they are due."""
+    for _, rows in iter_badge_caps_ordered(urls, engine, concurrency, url_timeout):
+        yield from rows
@@ -1,10 +1,35 @@
 import streamlit as st
-import pandas as pd
-from .logic import run_badge_caps_for_url, run_badge_caps_bulk
+from .logic import (
+    run_badge_caps_for_url,
+    read_url_list,
+    iter_badge_caps_ordered,
+    badge_matcher,
+    ENGINE,
+    ENGINES,
+    BULK_CONCURRENCY,
+    URL_TIMEOUT,
+    COLUMNS,
+)
+from modules.live_table import LiveTable, download_file, scratch_path
+from modules.results_sink import open_sink
 
 def run():
     st.title("Badge Caps Checker")
 
+    engine = st.radio(
+        "Engine", ENGINES, index=ENGINES.index(ENGINE), horizontal=True, key="badge_engine",
+        help="browser: render every page; auto: raw HTML first, browser render only when it "
+             "looks incomplete (misses badges added by JavaScript)",
+    )
+
+    with st.expander("Allowed badge patterns"):
+        try:
+            st.code(badge_matcher()["selector"].replace(", ", ",\n"), language="css")
+            st.caption("Set BAU_BADGE_PATTERNS to a JSON file to change the whitelist.")
+        except (OSError, ValueError) as e:
+            st.error(f"❌ Could not load badge patterns: {e}")
+            st.stop()
+
     tab1, tab2 = st.tabs(["Single URL Check", "Bulk URL Check"])
 
     # ✅ TAB 1 — SINGLE URL
@@ -18,8 +43,9 @@ def run():
                 st.warning("Please enter a valid URL")
             else:
                 with st.spinner("Checking badge caps..."):
-                    results = run_badge_caps_for_url(url)
+                    results = run_badge_caps_for_url(url, engine)
 
+                import pandas as pd
                 df = pd.DataFrame(results)
 
                 if not df.empty:
@@ -37,23 +63,29 @@ def run():
             type=["xlsx"]
         )
 
+        col1, col2 = st.columns(2)
+        concurrency = col1.number_input(
+            "Pages in flight", min_value=1, max_value=32, value=BULK_CONCURRENCY, key="badge_concurrency"
+        )
+        url_timeout = col2.number_input(
+            "Timeout per URL (s)", min_value=10, max_value=600, value=URL_TIMEOUT, key="badge_url_timeout"
+        )
+
         if uploaded_file is not None:
             if st.button("Run Bulk Validation", key="bulk"):
-                with st.spinner("Processing multiple URLs..."):
-                    df, error = run_badge_caps_bulk(uploaded_file)
+                urls, error = read_url_list(uploaded_file)
 
                 if error:
                     st.error(error)
                 else:
-                    st.success("Bulk Validation Complete ✅")
-                    st.dataframe(df)
-
-                    # ✅ Download button
-                    csv = df.to_csv(index=False).encode("utf-8")
+                    # ✅ Rows stream into the table and the CSV in input order
+                    table = LiveTable(len(urls), COLUMNS)
+                    with scratch_path("badge_caps_results.csv") as path:
+                        with open_sink(path, COLUMNS) as sink:
+                            for _, rows in iter_badge_caps_ordered(urls, engine, concurrency, url_timeout):
+                                for row in rows:
+                                    sink.write(row)
+                                table.add(rows)
 
-                    st.download_button(
-                        label="Download Results as CSV",
-                        data=csv,
-                        file_name="badge_caps_results.csv",
-                        mime="text/csv",
-                    )
\ No newline at end of file
+                        table.finish("Bulk Validation Complete ✅")
+                        download_file("Download Results as CSV", path)
\ No newline at end of file
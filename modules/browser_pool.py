@@ -0,0 +1,253 @@
+import asyncio
+import atexit
+import json
+import threading
+from contextlib import asynccontextmanager
+
+# -------------------------
+# Configuration
+# -------------------------
+
+POOL_BROWSERS = 2          # warm Chromium instances kept alive for the process
+MAX_PAGES = 8              # pages in flight across every module
+CONTEXT_MAX_USES = 25      # recycle a browser context after this many leases
+
+LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage"]
+
+
+# -------------------------
+# Pool
+# -------------------------
+
+class BrowserPool:
+    """
+    Process-wide set of warm Chromium browsers.
+
+    Playwright objects are bound to the event loop that created them, so the
+    pool owns one background thread running its own loop, and every browser,
+    context and page lives there. Callers hand over a coroutine function
+    `fn(page, *args)` and get its return value back:
+
+        pool.run(fn, url)          # from sync code / any thread (blocks)
+        await pool.arun(fn, url)   # from code running on another event loop
+
+    Contexts are leased per option set (user agent, http credentials, ...)
+    and closed after `max_uses` leases. `isolated=True` leases a brand-new
+    context that is thrown away afterwards (needed when cookies must not
+    carry over, e.g. form submissions). A browser that crashed or
+    disconnected is dropped and relaunched on the next lease.
+    """
+
+    def __init__(self, browsers=POOL_BROWSERS, max_pages=MAX_PAGES,
+                 max_uses=CONTEXT_MAX_USES, headless=True):
+        self.size = max(1, browsers)
+        self.max_pages = max(1, max_pages)
+        self.max_uses = max(1, max_uses)
+        self.headless = headless
+        self.launches = 0
+
+        self._playwright = None
+        self._browsers = []   # [{"browser": Browser, "leases": int}]
+        self._idle = {}       # context key -> [lease, ...]
+        self._pages = None    # asyncio.Semaphore, created once Playwright is up
+        # asyncio locks bind to the loop on first use, i.e. the pool loop
+        self._start_lock = asyncio.Lock()
+        self._launch_lock = asyncio.Lock()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="browser-pool", daemon=True
+        )
+        self._thread.start()
+
+    # ---------- public API (any thread) ----------
+
+    def run(self, fn, *args, context_options=None, isolated=False, timeout=None):
+        future = self._submit(self._call(fn, args, context_options, isolated))
+        try:
+            return future.result(timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    async def arun(self, fn, *args, context_options=None, isolated=False):
+        future = self._submit(self._call(fn, args, context_options, isolated))
+        return await asyncio.wrap_future(future)
+
+    def set_max_pages(self, max_pages):
+        """Change the process-wide page budget; pages already leased keep their slot."""
+        self.max_pages = max(1, int(max_pages))
+        if self._pages is not None:
+            self._loop.call_soon_threadsafe(self._reset_page_budget)
+
+    def warm(self):
+        """Start Playwright and launch the first browser without blocking."""
+        self._submit(self._warm())
+
+    def health(self, timeout=30):
+        """Connection state and lease counts of every pooled browser."""
+        return self._submit(self._health()).result(timeout)
+
+    def close(self, timeout=30):
+        if not self._loop.is_running():
+            return
+        try:
+            self._submit(self._close()).result(timeout)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    # ---------- pool loop ----------
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _ensure_started(self):
+        if self._playwright is not None:
+            return
+        # held across the start, so callers arriving before the first start
+        # finishes wait for it instead of each starting their own driver
+        async with self._start_lock:
+            if self._playwright is None:
+                if self._pages is None:
+                    self._pages = asyncio.Semaphore(self.max_pages)
+
+                from playwright.async_api import async_playwright
+                self._playwright = await async_playwright().start()
+
+    def _reset_page_budget(self):
+        self._pages = asyncio.Semaphore(self.max_pages)
+
+    async def _warm(self):
+        await self._ensure_started()
+        async with self._launch_lock:
+            if not self._browsers:
+                self._browsers.append(await self._launch())
+
+    async def _launch(self):
+        browser = await self._playwright.chromium.launch(
+            headless=self.headless, args=LAUNCH_ARGS
+        )
+        self.launches += 1
+        return {"browser": browser, "leases": 0}
+
+    async def _pick_browser(self):
+        async with self._launch_lock:
+            # health check: forget browsers that crashed or were closed
+            for slot in list(self._browsers):
+                if not slot["browser"].is_connected():
+                    self._browsers.remove(slot)
+                    for key, leases in self._idle.items():
+                        self._idle[key] = [l for l in leases if l["slot"] is not slot]
+
+            # only grow the pool when every warm browser is already busy
+            if len(self._browsers) < self.size and all(s["leases"] for s in self._browsers):
+                self._browsers.append(await self._launch())
+
+            return min(self._browsers, key=lambda s: s["leases"])
+
+    async def _lease(self, options, isolated):
+        key = json.dumps(options, sort_keys=True, default=str)
+
+        if not isolated:
+            idle = self._idle.get(key, [])
+            while idle:
+                lease = idle.pop()
+                if lease["slot"]["browser"].is_connected():
+                    lease["uses"] += 1
+                    lease["slot"]["leases"] += 1
+                    return lease
+
+        slot = await self._pick_browser()
+        context = await slot["browser"].new_context(**options)
+        slot["leases"] += 1
+        return {"context": context, "slot": slot, "key": key,
+                "uses": 1, "isolated": isolated, "broken": False}
+
+    async def _release(self, lease):
+        lease["slot"]["leases"] -= 1
+        reusable = (
+            not lease["isolated"]
+            and not lease["broken"]
+            and lease["uses"] < self.max_uses
+            and lease["slot"]["browser"].is_connected()
+        )
+        if reusable:
+            self._idle.setdefault(lease["key"], []).append(lease)
+            return
+        try:
+            await lease["context"].close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def _page(self, options, isolated):
+        await self._ensure_started()
+        budget = self._pages
+        async with budget:
+            lease = await self._lease(options, isolated)
+            page = None
+            try:
+                try:
+                    page = await lease["context"].new_page()
+                except Exception:
+                    lease["broken"] = True
+                    raise
+                yield page
+            finally:
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        lease["broken"] = True
+                await self._release(lease)
+
+    async def _call(self, fn, args, options, isolated):
+        async with self._page(options or {}, isolated) as page:
+            return await fn(page, *args)
+
+    async def _health(self):
+        return {
+            "browsers": [
+                {"connected": s["browser"].is_connected(), "leases": s["leases"]}
+                for s in self._browsers
+            ],
+            "idle_contexts": sum(len(v) for v in self._idle.values()),
+            "launches": self.launches,
+        }
+
+    async def _close(self):
+        for leases in self._idle.values():
+            for lease in leases:
+                try:
+                    await lease["context"].close()
+                except Exception:
+                    pass
+        self._idle.clear()
+        for slot in self._browsers:
+            try:
+                await slot["browser"].close()
+            except Exception:
+                pass
+        self._browsers.clear()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+# -------------------------
+# Process-wide instance
+# -------------------------
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the shared BrowserPool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.close)
+        return _pool
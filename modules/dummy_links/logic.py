@@ -1,7 +1,34 @@
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
 
+from modules import http_client
+from modules.browser_pool import get_pool
+from modules.page_extract import dom_path, extract_one
+from modules.parsing import make_soup
+from modules.static_page import ENGINES, looks_unrendered
+
+# -------------------------
+# Configuration
+# -------------------------
+
+FETCH_TIMEOUT = 15         # seconds per request
+RETRIES = 2                # retries on connection errors / 429 / 5xx, with backoff
+BULK_CONCURRENCY = 16      # URLs fetched at once (http_client caps each host)
+
+# "static": raw server HTML only; "browser": render every page on the shared
+# browser pool; "auto": raw HTML first, rendered only when it has fewer
+# than MIN_STATIC_ANCHORS anchors (links injected client-side) or could
+# not be fetched
+ENGINE = "auto"
+MIN_STATIC_ANCHORS = 5
+RENDER_PAGES = 4           # pages rendered at once (per process) when a URL needs the browser
+URL_TIMEOUT = 90           # seconds one rendered URL may take once it has a page
+PAGE_TIMEOUT_MS = 60000
+
+# One row per dummy link, and one count row per checked URL
+LINK_COLUMNS = ["URL", "Link No.", "Link Text", "Href", "DOM Path"]
+COUNT_COLUMNS = ["URL", "Dummy Links", "Status"]
 
 
 # Texts to ignore on every page (case-insensitive)
@@ -12,17 +39,19 @@ IGNORE_TEXTS = {
 }
 
 
+# hrefs that don't go anywhere (compared stripped and lower-cased);
+# an empty or missing href counts as well
+DUMMY_HREF_PREFIXES = ("#",)
+DUMMY_HREFS = ("javascript:void(0)", "javascript:void(0);")
+
+
 def is_dummy_link(href):
     if not href:
         return True
 
     href = href.strip().lower()
 
-    return (
-        href == "#"
-        or href.startswith("#")
-        or href in ("javascript:void(0)", "javascript:void(0);")
-    )
+    return href.startswith(DUMMY_HREF_PREFIXES) or href in DUMMY_HREFS
 
 
 def should_ignore_link(text):
@@ -45,46 +74,183 @@ def clean_link_text(text):
     return text
 
 
-def fetch_dummy_links(url):
+# -------------------------
+# Extraction
+# -------------------------
+# Data the check needs: href, text and DOM path of every anchor whose href
+# is a dummy one (same rules as is_dummy_link, applied in the page).
+
+DUMMY_LINKS_JS = """
+(rules) => [...document.querySelectorAll("a")]
+    .filter((a) => {
+        const raw = a.getAttribute("href") || "";
+        if (!raw) return true;
+        const href = raw.trim().toLowerCase();
+        return rules.prefixes.some((p) => href.startsWith(p)) || rules.hrefs.includes(href);
+    })
+    .map((a) => ({href: a.getAttribute("href") || "", text: strippedText(a), path: domPath(a)}))
+"""
+
+
+def extract_dummy_links(soup):
+    """The DUMMY_LINKS_JS data, read from a parsed page."""
+    return [
+        {"href": a.get("href", ""), "text": a.get_text(strip=True), "path": dom_path(a)}
+        for a in soup.find_all("a")
+        if is_dummy_link(a.get("href", ""))
+    ]
+
+
+def dummy_link_extractor():
+    rules = {"prefixes": list(DUMMY_HREF_PREFIXES), "hrefs": list(DUMMY_HREFS)}
+    return {"js": DUMMY_LINKS_JS, "arg": rules, "soup": extract_dummy_links}
+
+
+def dummy_links_from_data(links, url=""):
+    """One LINK_COLUMNS row per extracted dummy (#, javascript:void) link."""
+    rows = []
+
+    for link in links:
+        text = clean_link_text(link["text"])
+
+        if should_ignore_link(text):
+            continue
+
+        rows.append({
+            "URL": url,
+            "Link No.": len(rows) + 1,
+            "Link Text": text,
+            "Href": link["href"],
+            "DOM Path": link["path"],
+        })
+
+    return rows
+
+
+def find_dummy_links(soup, url=""):
+    """Dummy (#, javascript:void) link rows for a parsed page."""
+    return dummy_links_from_data(extract_dummy_links(soup), url)
+
+
+def fetch_static_soup(url, retries=RETRIES):
+    """
+    (soup, None) for the raw HTML at `url`, or (None, error) where `error`
+    is the requests exception: requests.HTTPError for an error status,
+    anything else for a connection problem.
+    """
+    import requests
+
     try:
-        response = requests.get(url, timeout=15)
+        response = http_client.get_with_retry(url, retries=retries, timeout=FETCH_TIMEOUT)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        return make_soup(response.text), None
 
-        dummy_links = []
-        count = 1
+    except requests.RequestException as e:
+        return None, e
 
-        for a in soup.find_all("a"):
-            href = a.get("href", "")
-            raw_text = a.get_text(strip=True)
-            text = clean_link_text(raw_text)
 
-            if should_ignore_link(text):
-                continue
+def needs_render(soup):
+    """Raw HTML that is missing, an app shell, or has suspiciously few anchors."""
+    return looks_unrendered(soup) or len(soup.find_all("a", limit=MIN_STATIC_ANCHORS)) < MIN_STATIC_ANCHORS
 
-            if is_dummy_link(href):
-                dummy_links.append(
-                    f"[{count}] {text}\n    href={href}"
-                )
-                count += 1
 
-        if not dummy_links:
-            return "No dummy links found"
+async def check_dummy_links(page, url):
 
-        return "\n\n".join(dummy_links)
+    try:
+        response = await page.goto(url, timeout=PAGE_TIMEOUT_MS, wait_until="networkidle")
+        if response is not None and response.status >= 400:
+            return [], f"{response.status} {response.status_text} for url: {url}"
+        return dummy_links_from_data(await extract_one(page, dummy_link_extractor()), url), None
 
-    except requests.RequestException as e:
-        return f"ERROR: {e}"
+    except Exception as e:
+        return [], str(e)
+
+
+async def check_dummy_links_within(page, url, url_timeout=URL_TIMEOUT):
+    """check_dummy_links() with `url_timeout` counted from when the page is leased."""
+    try:
+        return await asyncio.wait_for(check_dummy_links(page, url), url_timeout)
+    except asyncio.TimeoutError:
+        return [], f"Timed out after {url_timeout}s"
+
+
+# Caps this module's renders at RENDER_PAGES, whatever the pool's own budget
+_render_slots = threading.BoundedSemaphore(RENDER_PAGES)
+
+
+def render_dummy_links(url, url_timeout=URL_TIMEOUT):
+    with _render_slots:
+        return get_pool().run(check_dummy_links_within, url, url_timeout)
+
+
+def fetch_dummy_links(url, engine=ENGINE, retries=RETRIES):
+    """
+    (rows, None) for the page at `url` with the chosen engine (see
+    ENGINE), or ([], error) when it can't be loaded.
+    """
+    if engine == "browser":
+        return render_dummy_links(url)
+
+    import requests
+
+    soup, error = fetch_static_soup(url, retries)
+    if engine == "static" or isinstance(error, requests.HTTPError):
+        # a 404/500 is a broken URL, not a page rendering would fix
+        return (find_dummy_links(soup, url), None) if soup is not None else ([], str(error))
+    if not needs_render(soup):
+        return find_dummy_links(soup, url), None
 
-def run_dummy_links_single(url):
-    result = fetch_dummy_links(url)
-    return result
+    return render_dummy_links(url)
+
+
+def summarize_dummy_links(url, rows, error=None):
+    """The COUNT_COLUMNS row for one URL."""
+    return {
+        "URL": url,
+        "Dummy Links": len(rows),
+        "Status": f"Error: {error}" if error else "OK",
+    }
+
+
+def run_dummy_links_single(url, engine=ENGINE):
+    return fetch_dummy_links(url, engine)
+
+
+def read_url_list(file):
+    """URLs from the "URL" column of an uploaded Excel file."""
+    import pandas as pd
 
-def run_dummy_links_bulk(file):
     df = pd.read_excel(file)
 
     if "URL" not in df.columns:
         return None, "Excel must contain a column named 'URL'"
 
-    df["Dummy_Links"] = df["URL"].apply(fetch_dummy_links)
-    return df, None
\ No newline at end of file
+    return [str(url).strip() for url in df["URL"].dropna()], None
+
+
+def iter_dummy_links_pages(urls, concurrency=BULK_CONCURRENCY, engine=ENGINE):
+    """
+    Check up to `concurrency` URLs at once (raw HTML over the shared
+    session; rendering, when `engine` asks for it, uses at most
+    RENDER_PAGES pages of the browser pool) and yield (url, rows, error) in input
+    order, each as soon as it and every URL before it have finished.
+    """
+    urls = list(urls)
+    executor = ThreadPoolExecutor(max_workers=max(1, int(concurrency)))
+    try:
+        results = executor.map(lambda url: fetch_dummy_links(url, engine), urls)
+        for url, (rows, error) in zip(urls, results):
+            yield url, rows, error
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_dummy_link_rows(pages, on_count=None):
+    """
+    Flatten (url, rows, error) results into link rows; `on_count` gets
+    each URL's count row (see summarize_dummy_links) as it passes.
+    """
+    for url, rows, error in pages:
+        if on_count is not None:
+            on_count(summarize_dummy_links(url, rows, error))
+        yield from rows
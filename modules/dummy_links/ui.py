@@ -1,11 +1,25 @@
 import streamlit as st
-import pandas as pd
-from .logic import run_dummy_links_single, run_dummy_links_bulk
-import io
+from .logic import (
+    run_dummy_links_single,
+    read_url_list,
+    iter_dummy_links_pages,
+    summarize_dummy_links,
+    BULK_CONCURRENCY,
+    ENGINES,
+    COUNT_COLUMNS,
+    LINK_COLUMNS,
+)
+from modules.live_table import LiveTable, download_file, scratch_path
+from modules.results_sink import ExcelBookSink
 
 def run():
     st.title("🔗 Dummy Link Checker")
 
+    engine = st.radio(
+        "Engine", ENGINES, horizontal=True, key="dummy_engine",
+        help="auto: raw HTML first, browser render only when it has very few links",
+    )
+
     tab1, tab2 = st.tabs(["🔗 Single URL", "📁 Excel Upload"])
 
     # ---------------- TAB 1: Single URL ----------------
@@ -20,10 +34,17 @@ def run():
                 st.warning("Please enter a URL")
             else:
                 with st.spinner("Checking dummy links..."):
-                    result = run_dummy_links_single(url.strip())
+                    rows, error = run_dummy_links_single(url.strip(), engine)
+
+                import pandas as pd
 
-                st.success("✅ Done")
-                st.text(result)
+                if error:
+                    st.error(f"ERROR: {error}")
+                elif not rows:
+                    st.success("✅ No dummy links found")
+                else:
+                    st.success(f"✅ {len(rows)} dummy link(s) found")
+                    st.dataframe(pd.DataFrame(rows, columns=LINK_COLUMNS), use_container_width=True)
 
     # ---------------- TAB 2: Excel Upload ----------------
     with tab2:
@@ -32,24 +53,30 @@ def run():
             type=["xlsx"]
         )
 
+        concurrency = st.number_input(
+            "URLs in flight", min_value=1, max_value=64, value=BULK_CONCURRENCY, key="dummy_concurrency"
+        )
+
         if uploaded_file:
             if st.button("Run Bulk Check", key="bulk_dummy"):
-                with st.spinner("Checking dummy links..."):
-                    df_out, error = run_dummy_links_bulk(uploaded_file)
+                urls, error = read_url_list(uploaded_file)
 
                 if error:
                     st.error(error)
                 else:
-                    st.success("✅ Done")
-                    st.dataframe(df_out, use_container_width=True)
-
-                    output = io.BytesIO()
-                    df_out.to_excel(output, index=False, engine="openpyxl")
-                    output.seek(0)
-
-                    st.download_button(
-                        "⬇ Download Results",
-                        output,
-                        "dummy_link_results.xlsx",
-                        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
\ No newline at end of file
+                    # ✅ Per-URL counts stream into the table and both sheets
+                    # of the workbook in input order
+                    table = LiveTable(len(urls), COUNT_COLUMNS)
+                    sheets = {"Summary": COUNT_COLUMNS, "Dummy Links": LINK_COLUMNS}
+                    with scratch_path("dummy_link_results.xlsx") as path:
+                        with ExcelBookSink(path, sheets) as book:
+                            for page_url, rows, page_error in iter_dummy_links_pages(urls, concurrency, engine):
+                                count = summarize_dummy_links(page_url, rows, page_error)
+                                book["Summary"].write(count)
+                                for row in rows:
+                                    book["Dummy Links"].write(row)
+                                table.add([count])
+                            links = book["Dummy Links"].rows
+
+                        table.finish(f"✅ Done: {links} dummy link(s) on {len(urls)} URLs")
+                        download_file("⬇ Download Results", path)
\ No newline at end of file
@@ -2,14 +2,16 @@ import asyncio
 import json
 import random
 import string
-import openpyxl
 import os
 import glob
+import time
 from datetime import datetime
-from playwright.async_api import async_playwright
 from urllib.parse import urlparse, parse_qs
 from urllib.parse import urlsplit, urlunsplit
 
+from modules.browser_pool import get_pool
+from modules.progress import emit
+
 
 # =====================
 # CONFIG
@@ -20,6 +22,21 @@ DEV_PASSWORD = "broadridge1" # <-- put your dev password
 INPUT_FILE = r"C:\Users\nayakaj\PythonCode\input.xlsx"
 OUTPUT_FILE = r"C:\Users\nayakaj\PythonCode\output.xlsx"
 
+CONCURRENCY = 4   # parallel browser contexts (one URL each)
+BROWSERS = 1      # Chromium instances the contexts are spread over
+
+# Crash safety for long runs (see RunJournal)
+CHECKPOINT_ROWS = 25        # save the output workbook every N finished rows
+CHECKPOINT_SECONDS = 120    # ... or every T seconds, whichever comes first
+RESUME = False              # continue a previous run from OUTPUT_FILE + journal
+
+# Upper bounds for the event-driven waits in process_form_submission()
+SCROLL_SETTLE_MS = 2000             # bottom form to render after scrolling
+SUBMIT_RESPONSE_TIMEOUT_MS = 8000   # form-processor POST response after submit
+SUCCESS_TIMEOUT_MS = 8000           # "thank you" block to become visible
+
+BOTTOM_FORM_SELECTOR = "form.contact-us__form[data-tracker-identifier='Page bottom form']"
+
 # =====================
 # HELPERS
 # =====================
@@ -30,12 +47,14 @@ PARAM_COLS = [
     "campaign_id", "sub_source"
 ]
 
-def apply_dev_auth(url: str) -> str:
-    """Inject basic auth if URL is dev environment"""
+def apply_dev_auth(url: str, username=None, password=None) -> str:
+    """Inject basic auth if URL is dev environment (defaults to DEV_USERNAME/DEV_PASSWORD)"""
     if "dev" in url or "www-dev" in url:
         parts = url.split("://")
         if len(parts) == 2 and "@" not in parts[1]:
-            return f"{parts[0]}://{DEV_USERNAME}:{DEV_PASSWORD}@{parts[1]}"
+            username = username or DEV_USERNAME
+            password = password or DEV_PASSWORD
+            return f"{parts[0]}://{username}:{password}@{parts[1]}"
     return url
 
 
@@ -139,8 +158,16 @@ def validate_url_params_in_json(url: str, json_dict: dict):
         overall = "PASS" if all(v == "PASS" for v in results.values()) else "FAIL"
         return overall, results
 
-async def process_form_submission(page, url: str, counter: int):
-    url = apply_dev_auth(url)
+async def wait_for_event(event: asyncio.Event, timeout_ms: int) -> bool:
+    """Wait until `event` is set, giving up after timeout_ms. Returns True if it fired."""
+    try:
+        await asyncio.wait_for(event.wait(), timeout_ms / 1000)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+async def process_form_submission(page, url: str, counter: int, auth=None):
+    url = apply_dev_auth(url, *(auth or ()))
     payloads = {}
     # valid initial dictionary; no ellipses
     extra_values = {
@@ -150,6 +177,8 @@ async def process_form_submission(page, url: str, counter: int):
         "raw_response": None,
         "form_data_subset": {}
     }
+    # set once the form-processor response has been read and parsed
+    response_captured = asyncio.Event()
     # --- capture requests (for payload comparison) ---
     # --- capture requests (for payload comparison) ---
     def capture_request(req):
@@ -179,8 +208,10 @@ async def process_form_submission(page, url: str, counter: int):
 
     # ✅ Capture form-processor response
     async def handle_response(res):
+        captured = False
         try:
             if res.request.method == "POST" and "form-processor" in res.url.lower():
+                captured = True
                 print(f"🔎 Captured Response URL: {res.url}")
                 raw_text = await res.text()
                 extra_values["raw_response"] = {"raw_text": raw_text}
@@ -256,6 +287,9 @@ async def process_form_submission(page, url: str, counter: int):
 
         except Exception as e:
             print("⚠ Error in handle_response:", e)
+        finally:
+            if captured:
+                response_captured.set()
     page.on("response", lambda res: asyncio.create_task(handle_response(res)))
 
     await page.goto(url, timeout=60000)
@@ -269,12 +303,17 @@ async def process_form_submission(page, url: str, counter: int):
             pass
 
     await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-    await page.wait_for_timeout(2000)
+    # continue as soon as the bottom form is rendered; pages without one
+    # still get the old 2s settle time before falling back to the modal
+    try:
+        await page.wait_for_selector(BOTTOM_FORM_SELECTOR, state="attached", timeout=SCROLL_SETTLE_MS)
+    except:
+        pass
 
     # --- form detection with fallback ---
     form, form_source = None, "none"
-    if await page.locator("form.contact-us__form[data-tracker-identifier='Page bottom form']").count() > 0:
-        form = page.locator("form.contact-us__form[data-tracker-identifier='Page bottom form']").first
+    if await page.locator(BOTTOM_FORM_SELECTOR).count() > 0:
+        form = page.locator(BOTTOM_FORM_SELECTOR).first
         form_source = "bottom"
     elif await page.locator("div.nav-cta >> button.modal-trigger").count() > 0:
         await page.click("div.nav-cta >> button.modal-trigger")
@@ -327,12 +366,13 @@ async def process_form_submission(page, url: str, counter: int):
     confirmation_text = "No Thank You message found"
     try:
         await form.locator("button.contact-us__form-button[type='submit']").click()
-        await page.wait_for_timeout(8000)  # wait for network responses
+        # returns as soon as handle_response() has parsed the form-processor reply
+        await wait_for_event(response_captured, SUBMIT_RESPONSE_TIMEOUT_MS)
 
         # Confirmation text
         try:
             success_locator = page.locator("div.contact-us__success")
-            await success_locator.wait_for(state="visible", timeout=8000)
+            await success_locator.wait_for(state="visible", timeout=SUCCESS_TIMEOUT_MS)
             confirmation_text = await success_locator.inner_text()
         except:
             pass
@@ -382,178 +422,329 @@ async def process_form_submission(page, url: str, counter: int):
 # MAIN DRIVER
 # =====================
 
-async def main():
-    wb = openpyxl.load_workbook(INPUT_FILE)
-    sheet = wb.active
+RESULT_HEADERS = [
+    "URL", "Result", "Filled Fields", "Captured Payload", "Notes",
+    "Confirmation", "Form Source", "FormSubmissionId",
+    "fullURL", "page_id", "Raw JSON Response"
+] + PARAM_COLS + ["Overall Result"]
+
+
+def normalize_url(u: str):
+    parts = list(urlsplit(u.strip()))
+    if parts[2].endswith("/"):
+        parts[2] = parts[2].rstrip("/")
+    return urlunsplit(parts).lower()
+
+
+def write_result_row(sheet, i, url, outcome):
+    """Write one process_form_submission() outcome onto row i of the sheet."""
+    headers = RESULT_HEADERS
+    result, filled_data, submitted, notes, confirm, form_source, form_submission_id, \
+        full_url_val, page_id_val, extra_data = outcome
+
+    sheet.cell(row=i, column=headers.index("Result") + 1).value = result
+    sheet.cell(row=i, column=headers.index("Filled Fields") + 1).value = json.dumps(filled_data)
+    sheet.cell(row=i, column=headers.index("Captured Payload") + 1).value = json.dumps(submitted)
+    sheet.cell(row=i, column=headers.index("Notes") + 1).value = notes
+    sheet.cell(row=i, column=headers.index("Confirmation") + 1).value = confirm
+    sheet.cell(row=i, column=headers.index("Form Source") + 1).value = form_source
+    sheet.cell(row=i, column=headers.index("FormSubmissionId") + 1).value = form_submission_id
+    sheet.cell(row=i, column=headers.index("fullURL") + 1).value = full_url_val
+    sheet.cell(row=i, column=headers.index("page_id") + 1).value = page_id_val
+    if not isinstance(extra_data, dict):
+        # early ERROR outcomes (no form / no submit button) carry no response data
+        return
+    raw_response = extra_data.get("raw_response")
+    sheet.cell(row=i, column=headers.index("Raw JSON Response") + 1).value = \
+        json.dumps(raw_response) if raw_response else None
+
+    # --- Write parameter columns ---
+    param_dict = {}
+    try:
+        # 🧩 Merge UTM and campaign params from both sources (robust fallback)
+        # Prefer values parsed from fullURL inside handle_response()
+        form_subset = extra_data.get("form_data_subset", {})
+        if form_subset:
+            param_dict.update(form_subset)
+
+        # If still empty, fallback to 'FormParameters=' inside Notes
+        if (not param_dict) and "FormParameters=" in str(notes):
+            try:
+                form_params_json = str(notes).split("FormParameters=", 1)[-1]
+                parsed_params = json.loads(form_params_json)
+                if isinstance(parsed_params, dict):
+                    param_dict.update(parsed_params)
+            except Exception as ex:
+                print(f"⚠ Error parsing FormParameters JSON on row {i}: {ex}")
 
-    # add the parameter‑level columns
-    PARAM_COLS = [
-        "utm_medium", "utm_source", "utm_campaign",
-        "utm_term", "utm_content", "content_id",
-        "campaign_id", "sub_source"
-    ]
-
-    headers = [
-                  "URL", "Result", "Filled Fields", "Captured Payload", "Notes",
-                  "Confirmation", "Form Source", "FormSubmissionId",
-                  "fullURL", "page_id", "Raw JSON Response"
-              ] + PARAM_COLS + ["Overall Result"]
-    for idx, name in enumerate(headers, start=1):
-        if sheet.cell(row=1, column=idx).value != name:
-            sheet.cell(row=1, column=idx, value=name)
+    except Exception as e:
+        print(f"⚠ Error merging parameter dictionaries on row {i}: {e}")
+        param_dict = {}
 
-    url_col = headers.index("URL") + 1
-    result_col = headers.index("Result") + 1
-    filled_col = headers.index("Filled Fields") + 1
-    payload_col = headers.index("Captured Payload") + 1
-    notes_col = headers.index("Notes") + 1
-    confirm_col = headers.index("Confirmation") + 1
-    source_col = headers.index("Form Source") + 1
-    fsid_col = headers.index("FormSubmissionId") + 1
-    fullurl_col = headers.index("fullURL") + 1
-    pageid_col = headers.index("page_id") + 1
-    rawjson_col = headers.index("Raw JSON Response") + 1
-
-    async with async_playwright() as p:
-        # ✅ Auto-detect latest Chromium binary
-        base_path = os.path.expanduser(r"C:\Users\nayakaj\AppData\Local\ms-playwright")
-        chromium_folders = sorted(glob.glob(os.path.join(base_path, "chromium-*")), reverse=True)
-        if not chromium_folders:
-            raise FileNotFoundError("No Chromium install found. Please run: playwright install chromium")
-        chromium_path = os.path.join(chromium_folders[0], "chrome-win", "chrome.exe")
-        print(f"✅ Using Chromium binary: {chromium_path}")
-
-        browser = await p.chromium.launch(
-            headless=True,
-            executable_path=chromium_path
-        )
-
-        for i, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
-            url = row[url_col - 1]
-            print(f"Row {i} -> {url}")
-            current_result = row[result_col - 1]
-            if not url:
-                continue
-            #if current_result and str(current_result).strip():
-                #print(f"⚡ Skipping row {i} (already has result: {current_result})")
-                #continue
+    utmmedium_col = headers.index("utm_medium") + 1
+    for col_offset, param_name in enumerate(PARAM_COLS):
+        sheet.cell(row=i, column=utmmedium_col + col_offset).value = param_dict.get(param_name, "")
 
-            print(f"▶ Testing: {url}")
-            context = await browser.new_context()
-            page = await context.new_page()
-            try:
-                result, filled_data, submitted, notes, confirm, form_source, form_submission_id, \
-                    full_url_val, page_id_val, extra_data = await process_form_submission(page, url, i)
-                sheet.cell(row=i, column=result_col).value = result
-                sheet.cell(row=i, column=filled_col).value = json.dumps(filled_data)
-                sheet.cell(row=i, column=payload_col).value = json.dumps(submitted)
-                sheet.cell(row=i, column=notes_col).value = notes
-                sheet.cell(row=i, column=confirm_col).value = confirm
-                sheet.cell(row=i, column=source_col).value = form_source
-                sheet.cell(row=i, column=fsid_col).value = form_submission_id
-                sheet.cell(row=i, column=fullurl_col).value = full_url_val
-                sheet.cell(row=i, column=pageid_col).value = page_id_val
-                raw_response = extra_data.get("raw_response")
-                sheet.cell(row=i, column=rawjson_col).value = json.dumps(raw_response) if raw_response else None
-
-                # --- Write parameter columns ---
-                # --- Write parameter columns ---
-                param_dict = {}
-                try:
-                    # 🧩 Merge UTM and campaign params from both sources (robust fallback)
-                    if isinstance(extra_data, dict):
-                        # Prefer values parsed from fullURL inside handle_response()
-                        form_subset = extra_data.get("form_data_subset", {})
-                        if form_subset:
-                            param_dict.update(form_subset)
-
-                    # If still empty, fallback to 'FormParameters=' inside Notes
-                    if (not param_dict) and "FormParameters=" in str(notes):
-                        try:
-                            form_params_json = str(notes).split("FormParameters=", 1)[-1]
-                            parsed_params = json.loads(form_params_json)
-                            if isinstance(parsed_params, dict):
-                                param_dict.update(parsed_params)
-                        except Exception as ex:
-                            print(f"⚠ Error parsing FormParameters JSON on row {i}: {ex}")
-
-                except Exception as e:
-                    print(f"⚠ Error merging parameter dictionaries on row {i}: {e}")
-                    param_dict = {}
-
-                #start_col = len(headers) - len(PARAM_COLS) + 1
-                utmmedium_col = headers.index("utm_medium") + 1
-
-                for col_offset, param_name in enumerate(PARAM_COLS):
-                    sheet.cell(row=i, column=utmmedium_col + col_offset).value = param_dict.get(param_name, "")
-
-                # --- Compute Overall Result ---
-                try:
-                    url_value = str(url).strip()
-                    fullurl_value = str(full_url_val).strip()
-                    overall_col = len(headers)
-
-                    def normalize(u: str):
-                        parts = list(urlsplit(u.strip()))
-                        if parts[2].endswith("/"):
-                            parts[2] = parts[2].rstrip("/")
-                        return urlunsplit(parts).lower()
-
-                    if normalize(url_value) == normalize(fullurl_value):
-                        sheet.cell(row=i, column=overall_col).value = "PASS"
-                    else:
-                        sheet.cell(row=i, column=overall_col).value = "FAIL"
-                except Exception as e:
-                    print(f"⚠ Error computing Overall Result on row {i}: {e}")
-                    sheet.cell(row=i, column=len(headers)).value = "ERROR"
-            except Exception as e:
-                sheet.cell(row=i, column=result_col).value = "ERROR"
-                sheet.cell(row=i, column=notes_col).value = str(e)
-            finally:
-                await context.close()
+    # --- Compute Overall Result ---
+    overall_col = len(headers)
+    try:
+        if normalize_url(str(url)) == normalize_url(str(full_url_val)):
+            sheet.cell(row=i, column=overall_col).value = "PASS"
+        else:
+            sheet.cell(row=i, column=overall_col).value = "FAIL"
+    except Exception as e:
+        print(f"⚠ Error computing Overall Result on row {i}: {e}")
+        sheet.cell(row=i, column=overall_col).value = "ERROR"
 
 
+def write_error_row(sheet, i, error):
+    sheet.cell(row=i, column=RESULT_HEADERS.index("Result") + 1).value = "ERROR"
+    sheet.cell(row=i, column=RESULT_HEADERS.index("Notes") + 1).value = str(error)
 
-        await browser.close()
 
-    wb.save(OUTPUT_FILE)
-    print(f"✅ Results saved in {OUTPUT_FILE}")
+async def launch_chromium(p):
+    # ✅ Auto-detect latest Chromium binary
+    base_path = os.path.expanduser(r"C:\Users\nayakaj\AppData\Local\ms-playwright")
+    chromium_folders = sorted(glob.glob(os.path.join(base_path, "chromium-*")), reverse=True)
+    if not chromium_folders:
+        raise FileNotFoundError("No Chromium install found. Please run: playwright install chromium")
+    chromium_path = os.path.join(chromium_folders[0], "chrome-win", "chrome.exe")
+    print(f"✅ Using Chromium binary: {chromium_path}")
 
-async def run_single_url(url: str):
+    return await p.chromium.launch(
+        headless=True,
+        executable_path=chromium_path
+    )
 
-    from playwright.async_api import async_playwright
 
-    async with async_playwright() as p:
+def journal_path(output_file):
+    return f"{output_file}.journal.jsonl"
 
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
 
-        try:
-            result, filled_data, submitted, notes, confirm, form_source, form_submission_id, \
-                full_url_val, page_id_val, extra_data = await process_form_submission(page, url, 1)
+def replay_journal(sheet, output_file):
+    """Copy rows finished after the last checkpoint back onto the sheet."""
+    path = journal_path(output_file)
+    if not os.path.exists(path):
+        return 0
 
-            await context.close()
-            await browser.close()
-
-            return {
-                "URL": url,
-                "Result": result,
-                "Confirmation": confirm,
-                "Form Source": form_source,
-                "FormSubmissionId": form_submission_id,
-                "Full URL": full_url_val,
-                "Page ID": page_id_val,
-                "Notes": notes
-            }
+    replayed = 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # partially written last line from a crash
+            for col, value in enumerate(entry["values"], start=1):
+                sheet.cell(row=entry["row"], column=col).value = value
+            replayed += 1
+    return replayed
 
+
+class RunJournal:
+    """
+    Every finished row is appended to a JSONL journal next to the output
+    file as soon as it is written, and the whole workbook is saved to the
+    output path every `every_rows` rows or `every_seconds` seconds (the
+    journal is then emptied). After a crash, OUTPUT_FILE plus the journal
+    hold every finished row, which is what resume mode starts from.
+
+    With `append` (resumed runs) the existing journal is kept and added
+    to, so rows replayed from it stay on disk until the next checkpoint.
+    """
+
+    def __init__(self, wb, output_file, every_rows=None, every_seconds=None, append=False):
+        self.wb = wb
+        self.sheet = wb.active
+        self.output_file = output_file
+        self.path = journal_path(output_file)
+        self.every_rows = max(1, every_rows or CHECKPOINT_ROWS)
+        self.every_seconds = every_seconds or CHECKPOINT_SECONDS
+        self.pending = 0
+        self.last_save = time.monotonic()
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+
+    def record(self, i):
+        values = [
+            self.sheet.cell(row=i, column=col).value
+            for col in range(1, len(RESULT_HEADERS) + 1)
+        ]
+        self._file.write(json.dumps({"row": i, "values": values}, default=str) + "\n")
+        self._file.flush()
+        self.pending += 1
+
+        if self.pending >= self.every_rows or time.monotonic() - self.last_save >= self.every_seconds:
+            self.checkpoint()
+
+    def checkpoint(self):
+        tmp_path = f"{self.output_file}.tmp"
+        try:
+            self.wb.save(tmp_path)
+            os.replace(tmp_path, self.output_file)
         except Exception as e:
+            # e.g. output open in Excel: keep journaling, try again next time
+            print(f"⚠ Checkpoint save failed, journal kept: {e}")
+            return False
+
+        self._file.close()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self.pending = 0
+        self.last_save = time.monotonic()
+        print(f"💾 Checkpoint saved to {self.output_file}")
+        return True
+
+    def close(self):
+        saved = self.checkpoint()
+        self._file.close()
+        if saved:
+            os.remove(self.path)
+        return saved
+
+
+async def form_worker(browser, queue, sheet, journal=None, progress=None, auth=None):
+    """
+    Pull (row, url) items off the shared queue until it is empty.
+    Every URL still gets its own fresh context, so cookies and captured
+    payloads never leak between rows. Row start/finish events go to the
+    `progress` bus when one is given.
+    """
+    while True:
+        try:
+            i, url = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+        print(f"Row {i} -> {url}")
+        print(f"▶ Testing: {url}")
+        emit(progress, "row_started", row=i, url=url)
+        started = time.monotonic()
+        context = await browser.new_context()
+        page = await context.new_page()
+        try:
+            outcome = await process_form_submission(page, url, i, auth)
+            write_result_row(sheet, i, url, outcome)
+            result = outcome[0]
+        except Exception as e:
+            write_error_row(sheet, i, e)
+            result = "ERROR"
+        finally:
             await context.close()
-            await browser.close()
-            return {
-                "URL": url,
-                "Result": "ERROR",
-                "Notes": str(e)
-            }
+
+        emit(progress, "row_finished", row=i, url=url, result=result,
+             seconds=round(time.monotonic() - started, 1))
+
+        if journal is not None:
+            journal.record(i)
+
+
+async def main(input_file=None, output_file=None, concurrency=None, browsers=None, resume=None,
+               progress=None, username=None, password=None):
+    """
+    Run every URL in the input workbook through process_form_submission().
+
+    Rows are fed through a work queue to `concurrency` parallel contexts,
+    spread round-robin over `browsers` Chromium instances. Each result is
+    written back onto the row it came from, so the output layout is the
+    same as a serial run.
+
+    Progress is checkpointed to the output file while running. With
+    `resume`, an existing output file (plus its journal) is loaded instead
+    of the input and rows that already have a Result are skipped.
+
+    `progress` is an optional modules.progress.ProgressBus that receives
+    run/row events while the run is going. `username`/`password` are the
+    dev basic-auth credentials for this run (DEV_USERNAME/DEV_PASSWORD
+    when not given), so concurrent runs never share them via globals.
+    """
+    import openpyxl
+    from playwright.async_api import async_playwright
+
+    run_started = time.monotonic()
+    input_file = input_file or INPUT_FILE
+    output_file = output_file or OUTPUT_FILE
+    concurrency = max(1, int(concurrency or CONCURRENCY))
+    browsers = max(1, min(int(browsers or BROWSERS), concurrency))
+    resume = RESUME if resume is None else resume
+    auth = (username or DEV_USERNAME, password or DEV_PASSWORD)
+
+    resuming = resume and os.path.exists(output_file)
+    wb = openpyxl.load_workbook(output_file if resuming else input_file)
+    sheet = wb.active
+
+    if resume:
+        replayed = replay_journal(sheet, output_file)
+        if resuming or replayed:
+            print(f"↩ Resuming from {output_file} ({replayed} journaled rows replayed)")
+            emit(progress, "log", message=f"Resuming from {output_file} ({replayed} journaled rows replayed)")
+
+    headers = RESULT_HEADERS
+    for idx, name in enumerate(headers, start=1):
+        if sheet.cell(row=1, column=idx).value != name:
+            sheet.cell(row=1, column=idx, value=name)
+
+    url_col = headers.index("URL") + 1
+    result_col = headers.index("Result") + 1
+
+    queue = asyncio.Queue()
+    skipped = 0
+    for i, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
+        url = row[url_col - 1]
+        if not url:
+            continue
+        current_result = row[result_col - 1] if len(row) >= result_col else None
+        if resume and current_result and str(current_result).strip():
+            print(f"⚡ Skipping row {i} (already has result: {current_result})")
+            skipped += 1
+            continue
+        queue.put_nowait((i, url))
+
+    print(f"▶ {queue.qsize()} URLs queued ({concurrency} contexts on {browsers} browser(s))")
+    emit(progress, "run_started", total=queue.qsize(), skipped=skipped)
+
+    journal = RunJournal(wb, output_file, append=resume)
+    try:
+        async with async_playwright() as p:
+            launched = [await launch_chromium(p) for _ in range(browsers)]
+            try:
+                await asyncio.gather(*(
+                    form_worker(launched[n % browsers], queue, sheet, journal, progress, auth)
+                    for n in range(concurrency)
+                ))
+            finally:
+                for browser in launched:
+                    await browser.close()
+    finally:
+        saved = journal.close()
+
+    if saved:
+        print(f"✅ Results saved in {output_file}")
+    emit(progress, "run_finished", saved=saved, output_file=output_file,
+         seconds=round(time.monotonic() - run_started, 1))
+
+async def run_single_url(url: str):
+
+    try:
+        # isolated: a fresh context, so no cookies/UTM state from earlier checks
+        result, filled_data, submitted, notes, confirm, form_source, form_submission_id, \
+            full_url_val, page_id_val, extra_data = await get_pool().arun(
+                process_form_submission, url, 1, isolated=True
+            )
+
+        return {
+            "URL": url,
+            "Result": result,
+            "Confirmation": confirm,
+            "Form Source": form_source,
+            "FormSubmissionId": form_submission_id,
+            "Full URL": full_url_val,
+            "Page ID": page_id_val,
+            "Notes": notes
+        }
+
+    except Exception as e:
+        return {
+            "URL": url,
+            "Result": "ERROR",
+            "Notes": str(e)
+        }
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
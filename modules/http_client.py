@@ -0,0 +1,134 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+# -------------------------
+# Configuration
+# -------------------------
+
+MAX_HTTP_IN_FLIGHT = 32    # requests in flight across every module
+PER_HOST_LIMIT = 6         # requests in flight against any single host (default; see host_slot)
+POOL_CONNECTIONS = 50      # hosts kept in the keep-alive pool
+POOL_MAXSIZE = 32          # open connections kept per host
+
+# Retries for transient failures (connection errors, timeouts, these statuses)
+RETRIES = 2
+BACKOFF = 0.5              # seconds before the first retry, doubled after each
+MAX_BACKOFF = 10           # cap, also applied to a server's Retry-After
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# -------------------------
+# Shared session + budget
+# -------------------------
+
+_sessions = {}        # keep_cookies -> requests.Session
+_session_lock = threading.Lock()
+_in_flight = threading.BoundedSemaphore(MAX_HTTP_IN_FLIGHT)
+_in_flight_limit = MAX_HTTP_IN_FLIGHT
+_host_slots = {}      # (host, limit) -> BoundedSemaphore
+_host_slots_lock = threading.Lock()
+
+
+def get_session(keep_cookies=True):
+    """
+    Process-wide keep-alive session shared by the HTTP-based checks. With
+    keep_cookies=False, a second shared session whose cookie jar refuses
+    every cookie, for checks that must see each URL like a first visit.
+    """
+    with _session_lock:
+        session = _sessions.get(keep_cookies)
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if not keep_cookies:
+                from http.cookiejar import DefaultCookiePolicy
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            _sessions[keep_cookies] = session
+        return session
+
+
+def http_budget():
+    """How many requests may be in flight at once (process-wide)."""
+    return _in_flight_limit
+
+
+def set_http_budget(limit):
+    """Change how many requests may be in flight at once (process-wide)."""
+    global _in_flight, _in_flight_limit
+    _in_flight_limit = max(1, int(limit))
+    _in_flight = threading.BoundedSemaphore(_in_flight_limit)
+
+
+def host_slot(url, limit=None):
+    """
+    Semaphore limiting concurrent requests to the host of `url` to
+    `limit` (PER_HOST_LIMIT when not given). Callers passing the same
+    limit share one semaphore per host.
+    """
+    host = urlparse(url).netloc.lower()
+    key = (host, max(1, int(limit or PER_HOST_LIMIT)))
+    with _host_slots_lock:
+        slot = _host_slots.get(key)
+        if slot is None:
+            slot = _host_slots[key] = threading.BoundedSemaphore(key[1])
+        return slot
+
+
+def request(method, url, keep_cookies=True, host_limit=None, **kwargs):
+    """
+    session.request() that waits for a slot on the target host first and
+    then for one in the global HTTP budget (see get_session for
+    `keep_cookies`, host_slot for `host_limit`).
+    """
+    budget = _in_flight
+    with host_slot(url, host_limit), budget:
+        return get_session(keep_cookies).request(method, url, **kwargs)
+
+
+def head(url, **kwargs):
+    return request("HEAD", url, **kwargs)
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+# -------------------------
+# Retries
+# -------------------------
+
+def _retry_delay(response, attempt, backoff):
+    delay = backoff * (2 ** attempt)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, int(retry_after))
+    return min(delay, MAX_BACKOFF)
+
+
+def request_with_retry(method, url, retries=RETRIES, backoff=BACKOFF, **kwargs):
+    """
+    request() retried with exponential backoff on connection errors,
+    timeouts and RETRY_STATUSES. The host/global slots are released while
+    waiting. Returns the last response, or raises the last error.
+    """
+    import requests
+
+    for attempt in range(retries + 1):
+        response = None
+        try:
+            response = request(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+        time.sleep(_retry_delay(response, attempt, backoff))
+
+
+def get_with_retry(url, **kwargs):
+    return request_with_retry("GET", url, **kwargs)
@@ -0,0 +1,76 @@
+import os
+
+import streamlit as st
+
+from modules.jobs import get_job_manager
+from modules.live_table import MIME_TYPES
+
+# -------------------------
+# Job view
+# -------------------------
+# Shared by every page that runs background jobs (see modules.jobs): the
+# session keeps only the job ID and the page renders the job's progress.
+
+TABLE_COLUMNS = ["Row", "URL", "Status", "Result", "Seconds"]
+
+
+def render_job(job, show_logs=True, download_name=None):
+    """Table, progress, status, logs and output file of a job."""
+    state = job.progress
+
+    st.caption(f"{job.kind} job `{job.id}` – {job.status}")
+    if state.rows:
+        import pandas as pd
+        st.dataframe(
+            pd.DataFrame(state.table(), columns=TABLE_COLUMNS),
+            use_container_width=True,
+        )
+    st.progress(state.fraction)
+
+    if job.status == "queued":
+        st.info("Queued – waiting for a free worker...")
+    elif job.status == "running":
+        st.info(f"Processing... {state.finished}/{state.total} rows done ({job.elapsed}s)")
+    elif job.status == "failed":
+        st.error(f"❌ {job.kind} failed after {job.elapsed}s")
+    else:
+        st.success(f"✅ Completed in {job.elapsed}s! Results saved at: {job.config['output_file']}")
+
+    if show_logs or job.status == "failed":
+        st.text_area("📝 Logs", "\n".join(state.logs), height=300)
+
+    output_file = job.config["output_file"]
+    if job.done and os.path.exists(output_file):
+        with open(output_file, "rb") as f:
+            st.download_button(
+                "⬇️ Download Results",
+                f,
+                file_name=download_name or os.path.basename(output_file),
+                mime=MIME_TYPES.get(os.path.splitext(output_file)[1].lower()),
+                key=f"download_{job.id}",
+            )
+
+
+@st.fragment(run_every=1)
+def watch_job(job_id, show_logs=True, download_name=None):
+    """Re-render a running job every second without rerunning the page."""
+    job = get_job_manager().get(job_id)
+    if job is None or job.done:
+        # finished, or pruned from the job history: show_job takes it from here
+        st.rerun()
+    render_job(job, show_logs, download_name)
+
+
+def show_job(session_key, show_logs=True, download_name=None):
+    """Render the job whose ID is stored under `session_key`, if any."""
+    job_id = st.session_state.get(session_key)
+    if not job_id:
+        return
+    job = get_job_manager().get(job_id)
+    if job is None:
+        st.session_state.pop(session_key, None)
+        return
+    if job.done:
+        render_job(job, show_logs, download_name)
+    else:
+        watch_job(job_id, show_logs, download_name)
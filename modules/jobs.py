@@ -0,0 +1,153 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.progress import ProgressBus, RunProgress
+
+# -------------------------
+# Configuration
+# -------------------------
+
+MAX_RUNNING_JOBS = int(os.getenv("BAU_MAX_JOBS", "2"))   # jobs executing at once
+JOB_HISTORY = 50                                           # finished jobs kept for polling
+
+
+# -------------------------
+# Jobs
+# -------------------------
+
+class Job:
+    """
+    One submitted run. `config` holds the keyword arguments the run was
+    started with, so concurrent jobs never share settings through module
+    globals. `bus` receives the run's progress events; refresh() folds the
+    new ones into `progress` for display.
+    """
+
+    def __init__(self, kind, fn, config, workspace=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.fn = fn
+        self.config = dict(config)
+        self.workspace = workspace
+        self.status = "queued"      # queued -> running -> done / failed
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.bus = ProgressBus()
+        self.progress = RunProgress()
+        self._lock = threading.Lock()
+
+    @property
+    def done(self):
+        return self.status in ("done", "failed")
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return round((self.finished or time.time()) - self.started, 1)
+
+    def refresh(self):
+        """Apply progress events that arrived since the last call."""
+        with self._lock:
+            self.progress.apply_all(self.bus.drain())
+        return self
+
+    def run(self):
+        self.status = "running"
+        self.started = time.time()
+        try:
+            if asyncio.iscoroutinefunction(self.fn):
+                self.result = asyncio.run(self.fn(progress=self.bus, **self.config))
+            else:
+                self.result = self.fn(progress=self.bus, **self.config)
+            self.status = "done"
+        except Exception:
+            self.error = traceback.format_exc()
+            self.bus.emit("run_failed", error=self.error)
+            self.status = "failed"
+        finally:
+            self.finished = time.time()
+
+
+class JobManager:
+    """
+    Runs submitted jobs on a bounded worker pool and keeps them addressable
+    by job ID, so a Streamlit session only has to remember the ID and poll.
+    """
+
+    def __init__(self, max_running=MAX_RUNNING_JOBS, history=JOB_HISTORY):
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_running), thread_name_prefix="bau-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind, fn, workspace=None, **config):
+        """
+        Queue `fn(progress=bus, **config)` and return the new job's ID.
+        `fn` may be a plain or a coroutine function. `workspace` (see
+        job_workspace()) is deleted once the job drops out of the history.
+        """
+        job = Job(kind, fn, config, workspace)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(job.run)
+        return job.id
+
+    def get(self, job_id):
+        """The Job for `job_id` with its progress refreshed, or None."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job.refresh() if job else None
+
+    def jobs(self, kind=None):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job for job in jobs if kind is None or job.kind == kind]
+
+    def _prune(self):
+        finished = sorted((j for j in self._jobs.values() if j.done), key=lambda j: j.finished)
+        for job in finished[:max(0, len(self._jobs) - self.history)]:
+            del self._jobs[job.id]
+            cleanup_workspace(job.workspace)
+
+
+# -------------------------
+# Per-job files
+# -------------------------
+
+def job_workspace():
+    """Fresh temporary directory for one job's uploaded input and output."""
+    return tempfile.mkdtemp(prefix="bau_job_")
+
+
+def cleanup_workspace(path):
+    if path and os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+
+
+# -------------------------
+# Process-wide instance
+# -------------------------
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager():
+    """Return the shared JobManager, creating it on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
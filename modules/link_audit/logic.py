@@ -1,15 +1,11 @@
-import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
 from urllib.parse import urlparse, urljoin
-import streamlit as st
-import pandas as pd
-import io
 
-# ✅ Must be the first Streamlit call
-st.set_page_config(page_title="Link Behavior Audit", layout="wide")
-
-from bs4 import BeautifulSoup
-from openpyxl.styles import PatternFill
-from playwright.sync_api import sync_playwright
+from modules import http_client
+from modules.browser_pool import get_pool
+from modules.link_cache import get_link_cache, normalize_url
+from modules.page_extract import extract_one
 
 # -------------------------
 # Configuration
@@ -41,6 +37,24 @@ IGNORE_HREF_PATTERNS = [
 
 SOCIAL_DOMAINS = ["twitter.com", "facebook.com", "linkedin.com"]
 
+LINK_CHECK_WORKERS = 16   # link health checks in flight per page
+
+DOC_EXTENSIONS = (
+    ".pdf",
+    ".doc",
+    ".docx",
+    ".xls",
+    ".xlsx",
+    ".csv",
+    ".ppt",
+    ".pptx",
+)
+
+# Bulk / crawl
+PAGES_IN_FLIGHT = 4       # pages rendered at once
+CRAWL_MAX_DEPTH = 2       # link hops from the start URL
+CRAWL_MAX_PAGES = 200     # pages audited per crawl
+
 # -------------------------
 # Helpers
 # -------------------------
@@ -59,76 +73,156 @@ def extract_basic_auth(url: str):
     return url, "", ""
 
 
+def classify_status(code):
+    if 200 <= code < 300:
+        return "OK"
+    elif 300 <= code < 400:
+        return "Redirect"
+    elif 400 <= code < 500:
+        return "Client Error"
+    elif 500 <= code < 600:
+        return "Server Error"
+    else:
+        return "Unknown"
+
+
 def check_link_status(url, timeout=10):
+    cache = get_link_cache()
+    cached = cache.get(url)
+    if cached is not None:
+        return cached
+
     try:
-        response = requests.head(url, allow_redirects=True, timeout=timeout)
+        response = http_client.head(url, allow_redirects=True, timeout=timeout)
 
         if response.status_code >= 400:
-            response = requests.get(url, allow_redirects=True, timeout=timeout)
+            response = http_client.get(url, allow_redirects=True, timeout=timeout)
 
         code = response.status_code
+        link_health = classify_status(code)
 
-        if 200 <= code < 300:
-            return code, "OK"
-        elif 300 <= code < 400:
-            return code, "Redirect"
-        elif 400 <= code < 500:
-            return code, "Client Error"
-        elif 500 <= code < 600:
-            return code, "Server Error"
-        else:
-            return code, "Unknown"
+        # every hop of the redirect chain shares the final status
+        redirect_chain = [r.url for r in response.history] + [response.url]
+        cache.put(url, code, link_health, redirect_chain)
+        return code, link_health
 
     except Exception:
+        cache.put(url, "Error", "Unreachable")
         return "Error", "Unreachable"
 
 
+def check_links(urls, timeout=10):
+    """
+    Health of every distinct URL in `urls`, checked concurrently over the
+    shared keep-alive session. Returns {url: (status_code, health)}.
+    """
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return {}
+
+    workers = min(LINK_CHECK_WORKERS, len(unique))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        statuses = executor.map(lambda u: check_link_status(u, timeout), unique)
+        return dict(zip(unique, statuses))
+
+
 # -------------------------
 # Core Logic
 # -------------------------
 
+# Data the audit needs: every <a href> with the attributes the checks read,
+# flagged when it sits inside one of the IGNORE_SELECTORS blocks.
+LINKS_JS = """
+(ignoreSelectors) => [...document.querySelectorAll("a[href]")].map((a) => ({
+    href: a.getAttribute("href"),
+    text: strippedText(a),
+    aria_label: a.getAttribute("aria-label"),
+    title: a.getAttribute("title"),
+    target: a.getAttribute("target"),
+    ignored: ignoreSelectors.some((selector) => a.closest(selector) !== null),
+}))
+"""
+
+
+async def fetch_rendered_links(page, page_url):
+    await page.goto(page_url, wait_until="networkidle", timeout=30000)
+    await page.wait_for_selector("a", timeout=10000)
+    return await extract_one(page, link_extractor())
+
+
+def fetch_page_links(page_url, username="", password=""):
+    """Extracted links (see LINKS_JS) of the rendered page."""
+    context_options = (
+        {"http_credentials": {"username": username, "password": password}}
+        if username and password
+        else None
+    )
+    return get_pool().run(
+        fetch_rendered_links, page_url, context_options=context_options
+    )
+
+
 def analyze_links(page_url, username="", password=""):
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-dev-shm-usage"],
-            )
+        links = fetch_page_links(page_url, username, password)
+    except Exception as e:
+        return [], f"Error fetching page: {e}"
 
-            context = browser.new_context(
-                http_credentials={
-                    "username": username,
-                    "password": password,
-                }
-                if username and password
-                else None
-            )
+    return links_from_data(links, page_url), None
 
-            page = context.new_page()
-            page.goto(page_url, wait_until="networkidle", timeout=30000)
-            page.wait_for_selector("a", timeout=10000)
 
-            html = page.content()
+def ignored_link_ids(soup):
+    """
+    ids of <a> tags inside IGNORE_SELECTORS blocks. Collected instead of
+    decompose()-ing those blocks so the same soup can be shared with
+    other checkers.
+    """
+    ignored = set()
+    for selector in IGNORE_SELECTORS:
+        for tag in soup.select(selector):
+            if tag.name == "a":
+                ignored.add(id(tag))
+            ignored.update(id(a) for a in tag.find_all("a"))
+    return ignored
 
-            context.close()
-            browser.close()
 
-    except Exception as e:
-        return [], f"Error fetching page: {e}"
+def extract_links(soup):
+    """The LINKS_JS data, read from a parsed page."""
+    ignored = ignored_link_ids(soup)
+    return [
+        {
+            "href": a.get("href"),
+            "text": a.get_text(strip=True),
+            "aria_label": a.get("aria-label"),
+            "title": a.get("title"),
+            "target": a.get("target"),
+            "ignored": id(a) in ignored,
+        }
+        for a in soup.find_all("a", href=True)
+    ]
 
-    soup = BeautifulSoup(html, "html.parser")
 
-    for selector in IGNORE_SELECTORS:
-        for tag in soup.select(selector):
-            tag.decompose()
+def link_extractor():
+    return {"js": LINKS_JS, "arg": IGNORE_SELECTORS, "soup": extract_links}
+
+
+def audit_links(soup, page_url):
+    """Link behaviour + health rows for an already-parsed page."""
+    return links_from_data(extract_links(soup), page_url)
 
-    links = soup.find_all("a", href=True)
+
+def links_from_data(links, page_url):
+    """Link behaviour + health rows for the extracted links of one page."""
     base_domain = urlparse(page_url).netloc
 
     results = []
+    checked_urls = []
 
     for link in links:
-        href = link.get("href")
+        if link["ignored"]:
+            continue
+
+        href = link["href"]
         if not href:
             continue
 
@@ -142,9 +236,9 @@ def analyze_links(page_url, username="", password=""):
         parsed_url = urlparse(absolute_url)
 
         link_text = (
-            link.get_text(strip=True)
-            or link.get("aria-label")
-            or link.get("title")
+            link["text"]
+            or link["aria_label"]
+            or link["title"]
             or absolute_url
         )
 
@@ -154,22 +248,12 @@ def analyze_links(page_url, username="", password=""):
                 is_external = True
                 break
 
-        opens_in = "New Tab" if link.get("target") == "_blank" else "Same Tab"
+        opens_in = "New Tab" if link["target"] == "_blank" else "Same Tab"
 
         if any(domain in href for domain in SOCIAL_DOMAINS):
             opens_in = "New Tab"
 
-        doc_extensions = (
-            ".pdf",
-            ".doc",
-            ".docx",
-            ".xls",
-            ".xlsx",
-            ".csv",
-            ".ppt",
-            ".pptx",
-        )
-        is_document = absolute_url.lower().endswith(doc_extensions)
+        is_document = absolute_url.lower().endswith(DOC_EXTENSIONS)
 
         if is_document:
             is_external = True
@@ -192,18 +276,177 @@ def analyze_links(page_url, username="", password=""):
             else:
                 reason = "Internal OK" if expected == "✔" else "Internal should open Same Tab"
 
-        status_code, link_health = check_link_status(absolute_url)
-
         results.append(
             {
                 "Link Text": link_text,
                 "Opens In": opens_in,
                 "Internal/External": "External" if is_external else "Internal",
-                "HTTP Status": status_code,
-                "Link Health": link_health,
+                "HTTP Status": None,
+                "Link Health": None,
                 "Expected?": expected,
                 "Reason": reason,
             }
         )
+        checked_urls.append(absolute_url)
+
+    # ✅ Health-check each distinct URL once, concurrently
+    statuses = check_links(checked_urls)
+    for row, absolute_url in zip(results, checked_urls):
+        row["HTTP Status"], row["Link Health"] = statuses[absolute_url]
+
+    return results
+
+# -------------------------
+# Bulk / Crawl
+# -------------------------
+
+def internal_page_links(soup, page_url):
+    """Same-domain HTML pages linked from `page_url` (crawl candidates)."""
+    return internal_links_from_data(extract_links(soup), page_url)
+
+
+def internal_links_from_data(links, page_url):
+    """internal_page_links() for the extracted links of one page."""
+    base_domain = urlparse(page_url).netloc
+    found = []
+
+    for link in links:
+        href = (link["href"] or "").strip()
+        if not href or href.startswith(("tel:", "mailto:", "javascript:", "#")):
+            continue
+
+        absolute_url = urljoin(page_url, href).split("#", 1)[0]
+        parsed_url = urlparse(absolute_url)
+
+        if parsed_url.scheme not in ("http", "https") or parsed_url.netloc != base_domain:
+            continue
+        if absolute_url.lower().endswith(DOC_EXTENSIONS):
+            continue
+        if any(parsed_url.path.startswith(sp) for sp in SPECIAL_EXTERNAL_PATHS):
+            continue
+
+        found.append(absolute_url)
+
+    return list(dict.fromkeys(found))
+
+
+def audit_page(page_url, username="", password="", depth=0):
+    """Audit one page; the record also carries its crawlable links."""
+    record = {"url": page_url, "depth": depth, "results": [], "links": [], "error": None}
+    try:
+        links = fetch_page_links(page_url, username, password)
+    except Exception as e:
+        record["error"] = f"Error fetching page: {e}"
+        return record
+
+    try:
+        record["results"] = links_from_data(links, page_url)
+        record["links"] = internal_links_from_data(links, page_url)
+    except Exception as e:
+        record["error"] = f"Error auditing page: {e}"
+    return record
+
+
+def read_page_list(file):
+    import pandas as pd
+
+    df_in = pd.read_excel(file)
+
+    if "URL" not in df_in.columns:
+        return None, "Excel must contain a column named 'URL'"
+
+    return [str(u).strip() for u in df_in["URL"].dropna() if str(u).strip()], None
+
+
+def iter_audit_pages(urls, pages_in_flight=PAGES_IN_FLIGHT):
+    """
+    Audit every URL (credentials may be embedded per URL), yielding page
+    records as they finish. Pages share the browser pool and link cache.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, int(pages_in_flight))) as executor:
+        futures = []
+        for url in urls:
+            clean_url, username, password = extract_basic_auth(url)
+            futures.append(executor.submit(audit_page, clean_url, username, password))
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def iter_crawl_site(start_url, max_depth=CRAWL_MAX_DEPTH, max_pages=CRAWL_MAX_PAGES,
+                    pages_in_flight=PAGES_IN_FLIGHT):
+    """
+    Breadth-first crawl of the start URL's domain, auditing up to
+    `max_pages` pages at most `max_depth` link hops away. Yields page
+    records as they finish.
+    """
+    clean_url, username, password = extract_basic_auth(start_url)
+    pages_in_flight = max(1, int(pages_in_flight))
+
+    seen = {normalize_url(clean_url)}
+    queue = deque([(clean_url, 0)])
+    submitted = 0
+
+    with ThreadPoolExecutor(max_workers=pages_in_flight) as executor:
+        running = {}
+        while queue or running:
+            while queue and len(running) < pages_in_flight and submitted < max_pages:
+                url, depth = queue.popleft()
+                running[executor.submit(audit_page, url, username, password, depth)] = depth
+                submitted += 1
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                depth = running.pop(future)
+                record = future.result()
+
+                if depth < max_depth:
+                    for link in record["links"]:
+                        key = normalize_url(link)
+                        if key not in seen:
+                            seen.add(key)
+                            queue.append((link, depth + 1))
+
+                yield record
+
+
+SUMMARY_COLUMNS = ["Page URL", "Depth", "Links", "Broken", "Unexpected Behaviour", "Error"]
+AUDIT_COLUMNS = ["Page URL", "Link Text", "Opens In", "Internal/External",
+                 "HTTP Status", "Link Health", "Expected?", "Reason"]
+
+
+def summarize_page(record):
+    results = record["results"]
+    return {
+        "Page URL": record["url"],
+        "Depth": record["depth"],
+        "Links": len(results),
+        "Broken": sum(1 for r in results if r["Link Health"] in ("Client Error", "Server Error", "Unreachable")),
+        "Unexpected Behaviour": sum(1 for r in results if r["Expected?"] == "✘"),
+        "Error": record["error"] or "",
+    }
+
+
+def page_audit_rows(record):
+    """One row per link of a page record, tagged with its page."""
+    rows = [{"Page URL": record["url"], **row} for row in record["results"]]
+    if record["error"]:
+        rows.insert(0, {"Page URL": record["url"], "Reason": record["error"]})
+    return rows
+
+
+def iter_audit_rows(records):
+    """Flatten page records into one row per link, tagged with its page."""
+    for record in records:
+        yield from page_audit_rows(record)
+
+
+def audit_row_fill(row):
+    """Green for links that behave as expected, red for everything else."""
+    from openpyxl.styles import PatternFill
 
-    return results, None
\ No newline at end of file
+    color = "D4EDDA" if row.get("Expected?") == "✔" else "F8D7DA"
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
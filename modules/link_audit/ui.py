@@ -1,14 +1,98 @@
 import streamlit as st
-import pandas as pd
 import io
-from openpyxl.styles import PatternFill
-from .logic import analyze_links, extract_basic_auth
+from .logic import (
+    analyze_links,
+    extract_basic_auth,
+    read_page_list,
+    iter_audit_pages,
+    iter_crawl_site,
+    summarize_page,
+    page_audit_rows,
+    audit_row_fill,
+    AUDIT_COLUMNS,
+    SUMMARY_COLUMNS,
+    PAGES_IN_FLIGHT,
+    CRAWL_MAX_DEPTH,
+    CRAWL_MAX_PAGES,
+)
+from modules.live_table import LiveTable, download_file, scratch_path
+from modules.results_sink import ExcelBookSink
 
 
 def run():
 
     st.title("🔍 Link Behavior Audit Tool")
 
+    tab1, tab2, tab3 = st.tabs(["🔗 Single URL", "📁 Bulk Upload", "🕸 Site Crawl"])
+
+    with tab1:
+        run_single()
+
+    with tab2:
+        run_bulk()
+
+    with tab3:
+        run_crawl()
+
+
+def audit_pages(records_iter, file_name, total=None):
+    """
+    Stream page records into a summary table and a consolidated workbook
+    (a Summary sheet and every link on AuditResults), then offer it for download.
+    """
+    table = LiveTable(total, SUMMARY_COLUMNS, verb="Audited", unit="page(s)")
+    sheets = {"Summary": SUMMARY_COLUMNS, "AuditResults": AUDIT_COLUMNS}
+    with scratch_path(file_name) as path:
+        with ExcelBookSink(path, sheets, row_fills={"AuditResults": audit_row_fill}) as book:
+            for record in records_iter:
+                summary = summarize_page(record)
+                book["Summary"].write(summary)
+                for row in page_audit_rows(record):
+                    book["AuditResults"].write(row)
+                table.add([summary])
+
+        table.finish(f"✅ Audited {table.done} page(s)")
+        download_file("⬇️ Download consolidated Excel", path)
+
+
+def run_bulk():
+
+    uploaded_file = st.file_uploader("Upload Excel (.xlsx) with a 'URL' column", type=["xlsx"])
+    pages_in_flight = st.number_input(
+        "Pages in flight", min_value=1, max_value=16, value=PAGES_IN_FLIGHT, key="la_bulk_pages"
+    )
+
+    if uploaded_file and st.button("Run Bulk Audit"):
+        urls, error = read_page_list(uploaded_file)
+        if error:
+            st.error(error)
+            return
+
+        audit_pages(iter_audit_pages(urls, pages_in_flight), "link_audit_bulk_results.xlsx", total=len(urls))
+
+
+def run_crawl():
+
+    start_url = st.text_input("Start URL", "https://www.broadridge.com/", key="la_crawl_url")
+
+    col1, col2, col3 = st.columns(3)
+    max_depth = col1.number_input("Max depth", min_value=0, max_value=10, value=CRAWL_MAX_DEPTH)
+    max_pages = col2.number_input("Max pages", min_value=1, max_value=5000, value=CRAWL_MAX_PAGES)
+    pages_in_flight = col3.number_input(
+        "Pages in flight", min_value=1, max_value=16, value=PAGES_IN_FLIGHT, key="la_crawl_pages"
+    )
+
+    st.caption("Only pages on the start URL's domain are crawled.")
+
+    if st.button("Run Crawl"):
+        audit_pages(
+            iter_crawl_site(start_url.strip(), max_depth, max_pages, pages_in_flight),
+            "link_audit_crawl_results.xlsx",
+        )
+
+
+def run_single():
+
     st.markdown(
         """
 This app scans a webpage for all **links** and checks:
@@ -36,6 +120,9 @@ This app scans a webpage for all **links** and checks:
             st.error(error)
 
         elif results:
+            import pandas as pd
+            from openpyxl.styles import PatternFill
+
             df = pd.DataFrame(results)
             st.success(f"Found {len(df)} links.")
 
@@ -0,0 +1,174 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit
+
+# -------------------------
+# Configuration
+# -------------------------
+
+LINK_CACHE_TTL = 6 * 60 * 60        # seconds a checked status stays valid
+LINK_CACHE_ERROR_TTL = 5 * 60       # unreachable links are re-checked sooner
+LINK_CACHE_SIZE = 20000             # entries kept in memory (LRU)
+LINK_CACHE_DB = os.getenv("BAU_LINK_CACHE_DB", "")   # optional SQLite file
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+# -------------------------
+# Helpers
+# -------------------------
+
+def normalize_url(url: str) -> str:
+    """
+    Cache key for a link: lower-case scheme and host, default port and
+    #fragment dropped, empty path as "/". The query string is kept as-is.
+    URLs that can't be parsed (e.g. a non-numeric port) are their own key.
+    """
+    url = str(url).strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+
+    netloc = host
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parts.username:
+        userinfo = parts.username
+        if parts.password:
+            userinfo = f"{userinfo}:{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+# -------------------------
+# Cache
+# -------------------------
+
+class LinkStatusCache:
+    """
+    (HTTP status, health) per normalized URL with a TTL.
+
+    Entries live in an in-memory LRU and, when `db_path` is set, in a
+    SQLite table as well so later runs (and other processes) can reuse
+    them. A redirect chain is stored hop by hop: every URL in the chain
+    resolves to the same final status, so a page linking to the
+    redirecting and the final form of a URL only costs one check.
+    """
+
+    def __init__(self, ttl=LINK_CACHE_TTL, max_entries=LINK_CACHE_SIZE,
+                 db_path=LINK_CACHE_DB, error_ttl=LINK_CACHE_ERROR_TTL):
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS link_status ("
+                " url TEXT PRIMARY KEY, status TEXT, health TEXT,"
+                " final_url TEXT, expires REAL)"
+            )
+            self._db.commit()
+
+    def get(self, url):
+        key = normalize_url(url)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT status, health, final_url, expires FROM link_status WHERE url = ?",
+                    (key,),
+                ).fetchone()
+                if row:
+                    entry = {
+                        "status": json.loads(row[0]),
+                        "health": row[1],
+                        "final_url": row[2],
+                        "expires": row[3],
+                    }
+                    self._remember(key, entry)
+
+            if entry is None or entry["expires"] < now:
+                if entry is not None:
+                    self._memory.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry["status"], entry["health"]
+
+    def put(self, url, status, health, redirect_chain=()):
+        """
+        Store the result for `url` and for every hop in `redirect_chain`
+        (the URLs visited, ending with the final one).
+        """
+        ttl = self.error_ttl if health == "Unreachable" else self.ttl
+        chain = [url] + [u for u in redirect_chain if u]
+        final_url = chain[-1]
+        entry = {
+            "status": status,
+            "health": health,
+            "final_url": final_url,
+            "expires": time.time() + ttl,
+        }
+
+        keys = list(dict.fromkeys(normalize_url(u) for u in chain))
+        with self._lock:
+            for key in keys:
+                self._remember(key, dict(entry))
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO link_status VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (key, json.dumps(status), health, final_url, entry["expires"])
+                        for key in keys
+                    ],
+                )
+                self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM link_status")
+                self._db.commit()
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# -------------------------
+# Process-wide instance
+# -------------------------
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_link_cache():
+    """Return the shared LinkStatusCache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LinkStatusCache()
+        return _cache
@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import streamlit as st
+
+# -------------------------
+# Configuration
+# -------------------------
+
+REDRAW_SECONDS = 0.5       # bulk tables are redrawn at most this often
+PREVIEW_ROWS = 1000        # rows kept on screen; the full results go to the output file
+
+
+# -------------------------
+# Live table
+# -------------------------
+
+class LiveTable:
+    """
+    Status line, progress bar and result table of a bulk run, fed one
+    finished URL (or page) at a time with add(). Redraws are throttled to
+    REDRAW_SECONDS and only the last PREVIEW_ROWS rows stay on screen, so
+    each URL costs the same whether the sweep has ten URLs or ten thousand.
+    The complete results are written to a results_sink file alongside.
+    """
+
+    def __init__(self, total=None, columns=None, verb="Checked", unit="URLs"):
+        self.total = total
+        self.columns = columns
+        self.verb = verb
+        self.unit = unit
+        self.done = 0
+        self.row_count = 0
+        self.rows = deque(maxlen=PREVIEW_ROWS)
+        self._drawn = 0
+
+        self.status_box = st.empty()
+        self.progress_bar = st.progress(0) if total else None
+        self.table_box = st.empty()
+
+    def add(self, rows=()):
+        """Count one finished URL and queue its table rows."""
+        self.done += 1
+        for row in rows:
+            self.rows.append(row)
+            self.row_count += 1
+
+        if time.time() - self._drawn > REDRAW_SECONDS:
+            self._draw()
+            of_total = f" / {self.total}" if self.total else ""
+            self.status_box.info(f"{self.verb} {self.done}{of_total} {self.unit}...")
+
+    def finish(self, message):
+        self._draw()
+        if self.progress_bar:
+            self.progress_bar.progress(1.0)
+        self.status_box.success(message)
+
+    def _draw(self):
+        import pandas as pd
+
+        self._drawn = time.time()
+        if self.progress_bar:
+            self.progress_bar.progress(min(1.0, self.done / self.total))
+
+        with self.table_box.container():
+            if self.row_count > len(self.rows):
+                st.caption(f"Showing the last {len(self.rows)} of {self.row_count} rows; "
+                           "the download has all of them.")
+            st.dataframe(pd.DataFrame(list(self.rows), columns=self.columns), use_container_width=True)
+
+
+# -------------------------
+# Output files
+# -------------------------
+
+@contextmanager
+def scratch_path(file_name):
+    """Path for one run's output file, in a temporary folder removed afterwards."""
+    folder = tempfile.mkdtemp(prefix="bau_run_")
+    try:
+        yield os.path.join(folder, file_name)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+MIME_TYPES = {
+    ".csv": "text/csv",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def download_file(label, path, key=None):
+    """Download button for a finished output file."""
+    with open(path, "rb") as f:
+        st.download_button(
+            label,
+            f.read(),
+            os.path.basename(path),
+            MIME_TYPES.get(os.path.splitext(path)[1].lower()),
+            key=key,
+        )
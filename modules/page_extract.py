@@ -0,0 +1,128 @@
+import json
+import os
+
+from modules.parsing import make_soup
+
+# -------------------------
+# Configuration
+# -------------------------
+
+# How the checks read a page rendered in the browser:
+#   "dom"  - every checker's extractor runs inside the page and a single
+#            page.evaluate returns their compact JSON results
+#   "html" - the whole DOM is serialized with page.content() and parsed
+#            in Python (the old behaviour; useful to compare results)
+EXTRACTION_MODE = os.getenv("BAU_EXTRACTION", "dom")
+
+EXTRACTION_MODES = ["dom", "html"]
+
+# Shared by every extractor script. strippedText() matches BeautifulSoup's
+# get_text(strip=True): each text node stripped, empty ones dropped, joined
+# without a separator, <script>/<style> contents skipped. domPath() matches
+# dom_path() below.
+JS_HELPERS = """
+    const strippedText = (el) => {
+        const parts = [];
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            const parent = node.parentElement && node.parentElement.localName;
+            if (parent === "script" || parent === "style") continue;
+            const part = node.nodeValue.trim();
+            if (part) parts.push(part);
+        }
+        return parts.join("");
+    };
+    const domPath = (el) => {
+        const parts = [];
+        for (; el; el = el.parentElement) {
+            let part = el.localName + (el.id ? "#" + el.id : "");
+            const same = el.parentElement
+                ? [...el.parentElement.children].filter((c) => c.localName === el.localName)
+                : [el];
+            if (same.length > 1) part += `:nth-of-type(${same.indexOf(el) + 1})`;
+            parts.unshift(part);
+        }
+        return parts.join(" > ");
+    };
+"""
+
+
+def dom_path(element):
+    """
+    CSS-like location of a BeautifulSoup element, e.g.
+    html > body > nav#main-nav > a:nth-of-type(2)
+    """
+    parts = []
+    while element is not None and element.name != "[document]":
+        part = element.name + (f"#{element.get('id')}" if element.get("id") else "")
+        parent = element.parent
+        same = parent.find_all(element.name, recursive=False) if parent is not None else [element]
+        if len(same) > 1:
+            part += f":nth-of-type({next(i for i, e in enumerate(same, 1) if e is element)})"
+        parts.insert(0, part)
+        element = parent
+    return " > ".join(parts)
+
+
+# -------------------------
+# Extractors
+# -------------------------
+# An extractor declares the data one checker needs from a page:
+#   "js"   - source of a JS function (arg) => JSON-serializable data
+#   "arg"  - value passed to that function (optional)
+#   "soup" - Python function (soup) -> the same data, for raw HTML and
+#            for EXTRACTION_MODE = "html"
+
+def build_script(extractors):
+    """One JS function running every extractor, each isolated in try/catch."""
+    calls = ",\n".join(
+        f"        {json.dumps(name)}: run({spec['js'].strip()}, args[{json.dumps(name)}])"
+        for name, spec in extractors.items()
+    )
+    return (
+        "(args) => {\n"
+        f"{JS_HELPERS}\n"
+        "    const run = (fn, arg) => {\n"
+        "        try { return {data: fn(arg)}; }\n"
+        "        catch (e) { return {error: String(e)}; }\n"
+        "    };\n"
+        "    return {\n"
+        f"{calls}\n"
+        "    };\n"
+        "}"
+    )
+
+
+def extract_soup(soup, extractors):
+    """{name: (data, error)} for every extractor, computed from a parsed page."""
+    results = {}
+    for name, spec in extractors.items():
+        try:
+            results[name] = (spec["soup"](soup), None)
+        except Exception as e:
+            results[name] = (None, str(e))
+    return results
+
+
+async def extract_page(page, extractors, mode=None):
+    """
+    {name: (data, error)} for every extractor on the loaded `page`, read
+    with one page.evaluate (or one page.content() in "html" mode).
+    """
+    if not extractors:
+        return {}
+
+    if (mode or EXTRACTION_MODE) == "html":
+        return extract_soup(make_soup(await page.content()), extractors)
+
+    args = {name: spec.get("arg") for name, spec in extractors.items()}
+    raw = await page.evaluate(build_script(extractors), args)
+    return {name: (raw[name].get("data"), raw[name].get("error")) for name in extractors}
+
+
+async def extract_one(page, extractor):
+    """Data of a single extractor; raises when it failed in the page."""
+    data, error = (await extract_page(page, {"data": extractor}))["data"]
+    if error:
+        raise RuntimeError(error)
+    return data
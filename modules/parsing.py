@@ -0,0 +1,55 @@
+import os
+
+# -------------------------
+# Configuration
+# -------------------------
+
+# BeautifulSoup tree builder used by every checker. Empty = the fastest one
+# installed. Set BAU_HTML_PARSER=html.parser to get the old pure-Python
+# behaviour back (e.g. when comparing results).
+HTML_PARSER = os.getenv("BAU_HTML_PARSER", "")
+
+PREFERRED_PARSERS = ["lxml", "html.parser"]   # C-backed first
+
+
+# -------------------------
+# Parser selection
+# -------------------------
+
+_parser = None
+
+
+def _available(name):
+    from bs4.builder import builder_registry
+    return builder_registry.lookup(name) is not None
+
+
+def html_parser():
+    """Name of the tree builder make_soup() uses."""
+    global _parser
+    if _parser is None:
+        if HTML_PARSER:
+            if not _available(HTML_PARSER):
+                raise ValueError(f"BAU_HTML_PARSER={HTML_PARSER!r} is not installed")
+            _parser = HTML_PARSER
+        else:
+            _parser = next(name for name in PREFERRED_PARSERS if _available(name))
+    return _parser
+
+
+def set_html_parser(name=None):
+    """Switch the tree builder for this process (None = back to the default choice)."""
+    global _parser, HTML_PARSER
+    HTML_PARSER = name or ""
+    _parser = None
+    return html_parser()
+
+
+def make_soup(markup, parser=None):
+    """
+    BeautifulSoup for `markup` built with the configured parser. The
+    result is a normal BeautifulSoup tree, so find()/find_all()/select()
+    logic works unchanged whichever backend parsed it.
+    """
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(markup, parser or html_parser())
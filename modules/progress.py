@@ -0,0 +1,121 @@
+import queue
+import time
+from collections import deque
+
+# -------------------------
+# Configuration
+# -------------------------
+
+LOG_LINES = 200      # log messages kept for display by RunProgress
+
+
+# -------------------------
+# Event bus
+# -------------------------
+# Engines report what they are doing as small dict events instead of
+# printing, e.g.
+#
+#   {"event": "row_started",  "row": 5, "url": "...", "time": ...}
+#   {"event": "row_finished", "row": 5, "url": "...", "result": "PASS",
+#    "seconds": 7.2, "time": ...}
+#
+# Event types used by the form engine: run_started (total), row_started,
+# row_finished (result, seconds), log (message), run_finished (saved,
+# output_file, seconds) and run_failed (error).
+
+class ProgressBus:
+    """
+    Thread-safe queue of progress events. The engine thread emits, the UI
+    thread drains whatever has arrived since its last look, so each event
+    is handled exactly once no matter how long the run gets.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+
+    def emit(self, event, **fields):
+        self._queue.put({"event": event, "time": time.time(), **fields})
+
+    def log(self, message):
+        self.emit("log", message=message)
+
+    def drain(self, timeout=None):
+        """
+        Return every pending event. With `timeout`, wait up to that many
+        seconds for the first one instead of returning an empty list.
+        """
+        events = []
+        try:
+            if timeout is not None:
+                events.append(self._queue.get(timeout=timeout))
+            while True:
+                events.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return events
+
+
+def emit(bus, event, **fields):
+    """bus.emit() that does nothing when no bus was passed in."""
+    if bus is not None:
+        bus.emit(event, **fields)
+
+
+# -------------------------
+# Consumer state
+# -------------------------
+
+class RunProgress:
+    """
+    Per-row table and counters folded from bus events; apply() is O(1)
+    per event. Used by the Streamlit pages to render a live run.
+    """
+
+    def __init__(self, log_lines=LOG_LINES):
+        self.rows = {}              # row number -> {"Row", "URL", "Status", ...}
+        self.total = 0
+        self.finished = 0
+        self.done = False
+        self.error = None
+        self.summary = {}
+        self.logs = deque(maxlen=log_lines)
+
+    def apply(self, event):
+        kind = event["event"]
+        if kind == "run_started":
+            self.total = event.get("total", 0)
+        elif kind == "row_started":
+            self.logs.append(f"Row {event['row']} -> {event['url']}")
+            self.rows[event["row"]] = {
+                "Row": event["row"], "URL": event["url"], "Status": "Running",
+                "Result": "", "Seconds": None,
+            }
+        elif kind == "row_finished":
+            row = self.rows.setdefault(event["row"], {"Row": event["row"], "URL": event.get("url")})
+            row["Status"] = "Done"
+            row["Result"] = event.get("result", "")
+            row["Seconds"] = event.get("seconds")
+            self.finished += 1
+            self.logs.append(f"Row {event['row']} finished: {row['Result']} ({row['Seconds']}s)")
+        elif kind == "log":
+            self.logs.append(event["message"])
+        elif kind == "run_finished":
+            self.done = True
+            self.summary = event
+        elif kind == "run_failed":
+            self.done = True
+            self.error = event.get("error")
+            self.logs.append(self.error)
+
+    def apply_all(self, events):
+        for event in events:
+            self.apply(event)
+        return bool(events)
+
+    @property
+    def fraction(self):
+        return min(self.finished / self.total, 1.0) if self.total else 0.0
+
+    def table(self):
+        """Rows in sheet order, ready for pd.DataFrame()."""
+        return [self.rows[i] for i in sorted(self.rows)]
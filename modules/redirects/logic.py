@@ -0,0 +1,248 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+import time
+
+from modules import http_client
+from modules.progress import emit
+from modules.results_sink import open_sink
+
+# -------------------------
+# Configuration
+# -------------------------
+
+USERNAME = "broadridgedigital"     # basic auth for protected (dev) hosts
+PASSWORD = "broadridge1"
+
+# When to send USERNAME/PASSWORD:
+#   "challenge" - only after a host answers 401/403, then for every later
+#                 hop on that host
+#   "always"    - on every request
+#   "never"     - not at all
+AUTH_MODE = "challenge"
+AUTH_MODES = ["challenge", "always", "never"]
+
+TIMEOUT = 10               # seconds per request
+MAX_HOPS = 10              # redirects followed before giving up
+HEAD_FIRST = True          # probe with HEAD, fall back to GET when a server refuses it
+VERIFY_TLS = False         # dev/staging hosts often have self-signed certificates
+RETRIES = 1                # retries on connection errors / 429 / 5xx (http_client)
+BULK_CONCURRENCY = 16      # URLs checked at once, also against a single host
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+HEAD_REFUSED = {405, 501}  # "method not allowed" answers to HEAD
+AUTH_CHALLENGES = {401, 403}
+
+URL_COLUMN = "URLs"
+
+COLUMNS = [
+    URL_COLUMN, "Redirected URL", "Redirect Type", "Final Status Code",
+    "Final URL", "Hops", "Redirect Chain",
+]
+
+
+# -------------------------
+# Single URL
+# -------------------------
+
+def _probe(url, auth, head_first, timeout, host_limit=None):
+    """(response, method) for one hop, without following redirects."""
+    # cookie-less session: Set-Cookie from earlier URLs (locale, consent,
+    # sessions) must not change where later chains go
+    kwargs = {"allow_redirects": False, "timeout": timeout, "verify": VERIFY_TLS,
+              "auth": auth, "retries": RETRIES, "keep_cookies": False,
+              "host_limit": host_limit}
+
+    if head_first:
+        response = http_client.request_with_retry("HEAD", url, **kwargs)
+        if response.status_code not in HEAD_REFUSED:
+            return response, "HEAD"
+
+    # stream=True: only the status line and headers are read, not the body
+    response = http_client.request_with_retry("GET", url, stream=True, **kwargs)
+    response.close()
+    return response, "GET"
+
+
+def trace_redirects(url, auth_mode=AUTH_MODE, username=USERNAME, password=PASSWORD,
+                    head_first=HEAD_FIRST, max_hops=MAX_HOPS, timeout=TIMEOUT, host_limit=None):
+    """
+    Follow `url` hop by hop and return (hops, error). Every hop is
+    {"URL", "Status", "Location", "Method"}; `error` is set when the chain
+    could not be completed (request failure, loop, too many hops).
+    `host_limit` overrides http_client.PER_HOST_LIMIT for these requests.
+    """
+    import requests
+
+    if not VERIFY_TLS:
+        import urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    credentials = (username, password) if username and password and auth_mode != "never" else None
+    authed_hosts = set()
+    hops = []
+    seen = set()
+    current = url
+
+    try:
+        while True:
+            host = urlparse(current).netloc.lower()
+            use_auth = credentials if auth_mode == "always" or host in authed_hosts else None
+
+            response, method = _probe(current, use_auth, head_first, timeout, host_limit)
+            if (response.status_code in AUTH_CHALLENGES and credentials
+                    and use_auth is None and auth_mode == "challenge"):
+                authed_hosts.add(host)
+                response, method = _probe(current, credentials, head_first, timeout, host_limit)
+
+            location = response.headers.get("Location")
+            hops.append({
+                "URL": current,
+                "Status": response.status_code,
+                "Location": location,
+                "Method": method,
+            })
+            seen.add(current)
+
+            if response.status_code not in REDIRECT_STATUSES or not location:
+                return hops, None
+
+            current = urljoin(current, location)
+            if current in seen:
+                return hops, f"Redirect loop at {current}"
+            if len(hops) > max_hops:
+                return hops, f"More than {max_hops} redirects"
+
+    except requests.RequestException as e:
+        return hops, str(e)
+
+
+def format_chain(hops):
+    """e.g. "301 https://a/ -> 302 https://b/ -> 200 https://c/"."""
+    return " -> ".join(f"{hop['Status']} {hop['URL']}" for hop in hops)
+
+
+def check_redirect(url, **options):
+    """
+    One result row (see COLUMNS) for `url`. "Redirected URL" and "Redirect
+    Type" describe the first hop; "Final ..." the end of the chain; "Hops"
+    counts the redirects followed, including a last one that was not
+    (loop, too many hops). `options` are passed to trace_redirects.
+    """
+    url = str(url).strip()
+    hops, error = trace_redirects(url, **options)
+
+    if not hops:
+        return {
+            URL_COLUMN: url,
+            "Redirected URL": f"Error: {error}",
+            "Redirect Type": None,
+            "Final Status Code": None,
+            "Final URL": None,
+            "Hops": 0,
+            "Redirect Chain": "",
+        }
+
+    first, last = hops[0], hops[-1]
+    redirected = first["Status"] in REDIRECT_STATUSES and first["Location"]
+
+    return {
+        URL_COLUMN: url,
+        "Redirected URL": urljoin(url, first["Location"]) if redirected else "No Redirect",
+        "Redirect Type": first["Status"],
+        "Final Status Code": f"Error: {error}" if error else last["Status"],
+        "Final URL": last["URL"],
+        "Hops": sum(1 for hop in hops if hop["Status"] in REDIRECT_STATUSES and hop["Location"]),
+        "Redirect Chain": format_chain(hops),
+    }
+
+
+# -------------------------
+# Bulk
+# -------------------------
+
+def read_url_list(file, url_column=URL_COLUMN):
+    """URLs from the `url_column` column of an Excel/CSV file (headers are stripped)."""
+    import pandas as pd
+
+    name = getattr(file, "name", str(file)).lower()
+    df_in = pd.read_csv(file) if name.endswith(".csv") else pd.read_excel(file)
+    df_in.columns = df_in.columns.astype(str).str.strip()
+
+    if url_column not in df_in.columns:
+        return None, f"File must contain a column named '{url_column}'"
+
+    return [str(u).strip() for u in df_in[url_column].dropna() if str(u).strip()], None
+
+
+def summarize_redirect(row):
+    """Short verdict for progress tables, e.g. "301 -> 200 (2 hops)"."""
+    if row["Redirect Type"] is None:
+        return row["Redirected URL"]
+    if isinstance(row["Final Status Code"], str):     # chain broken off (loop, too many hops)
+        return f"{row['Redirect Type']} -> {row['Final Status Code']}"
+    if not row["Hops"]:
+        return f"No Redirect ({row['Redirect Type']})"
+    hops = "hop" if row["Hops"] == 1 else "hops"
+    return f"{row['Redirect Type']} -> {row['Final Status Code']} ({row['Hops']} {hops})"
+
+
+def iter_redirects(urls, concurrency=BULK_CONCURRENCY, progress=None, **options):
+    """
+    Check up to `concurrency` URLs at once over the shared session and
+    yield result rows in input order, each as soon as it and every URL
+    before it have finished. row_started / row_finished events (row =
+    1-based input position) go to `progress` as URLs start and finish.
+
+    Migration sheets are usually one host, so the per-host cap follows
+    `concurrency` (unless `host_limit` is passed), and the process-wide
+    HTTP budget is raised to it when lower.
+    """
+    urls = list(urls)
+    concurrency = max(1, int(concurrency))
+    options.setdefault("host_limit", concurrency)
+    if http_client.http_budget() < concurrency:
+        http_client.set_http_budget(concurrency)
+
+    def check(numbered):
+        row_number, url = numbered
+        emit(progress, "row_started", row=row_number, url=url)
+        started = time.time()
+        row = check_redirect(url, **options)
+        emit(progress, "row_finished", row=row_number, url=url,
+             result=summarize_redirect(row), seconds=round(time.time() - started, 2))
+        return row
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        yield from executor.map(check, enumerate(urls, start=1))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_redirect_audit(input_file, output_file, concurrency=BULK_CONCURRENCY,
+                       url_column=URL_COLUMN, progress=None, **options):
+    """
+    Check every URL in `input_file` and write the rows to `output_file`
+    (.xlsx/.csv/.jsonl/.parquet) in input order while the run goes on, so
+    a long run can be followed live (see modules.progress) and a partial
+    file survives an interrupted one. Returns the number of rows written.
+    """
+    started = time.time()
+    try:
+        urls, error = read_url_list(input_file, url_column)
+        if error:
+            raise ValueError(error)
+
+        emit(progress, "run_started", total=len(urls))
+        with open_sink(output_file, COLUMNS) as sink:
+            for row in iter_redirects(urls, concurrency, progress, **options):
+                sink.write(row)
+            saved = sink.rows
+
+    except Exception as e:
+        emit(progress, "run_failed", error=f"❌ {e}")
+        raise
+
+    emit(progress, "run_finished", saved=saved, output_file=output_file,
+         seconds=round(time.time() - started, 1))
+    return saved
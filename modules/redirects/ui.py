@@ -0,0 +1,107 @@
+import streamlit as st
+from .logic import (
+    trace_redirects,
+    run_redirect_audit,
+    AUTH_MODE,
+    AUTH_MODES,
+    BULK_CONCURRENCY,
+    HEAD_FIRST,
+    MAX_HOPS,
+    PASSWORD,
+    URL_COLUMN,
+    USERNAME,
+)
+from modules.job_view import show_job
+from modules.jobs import get_job_manager, job_workspace
+import os
+
+# ✅ Bulk runs are background jobs: the session only keeps the job ID and the
+# results are streamed to the job's own workspace as they come in
+JOB_KEY = "redirects_job"
+OUTPUT_NAME = "redirect_results.xlsx"
+
+
+def run():
+    st.title("↪️ Redirect Checker")
+    st.write("Follows every redirect hop and reports the full chain (301 validation for migrations).")
+
+    with st.expander("⚙️ Settings"):
+        auth_mode = st.radio(
+            "Send credentials", AUTH_MODES, index=AUTH_MODES.index(AUTH_MODE), horizontal=True,
+            key="redirects_auth_mode",
+            help="challenge: only after a host answers 401/403",
+        )
+        username = st.text_input("Username", value=USERNAME, key="redirects_username")
+        password = st.text_input("Password", value=PASSWORD, type="password", key="redirects_password")
+        head_first = st.checkbox(
+            "HEAD first", value=HEAD_FIRST, key="redirects_head_first",
+            help="Falls back to GET when a server refuses HEAD",
+        )
+        max_hops = st.number_input("Max hops", min_value=1, max_value=50, value=MAX_HOPS, key="redirects_max_hops")
+
+    options = {
+        "auth_mode": auth_mode,
+        "username": username,
+        "password": password,
+        "head_first": head_first,
+        "max_hops": int(max_hops),
+    }
+
+    tab1, tab2 = st.tabs(["🔗 Single URL", "📁 Bulk Upload"])
+
+    # ---------------- TAB 1: Single URL ----------------
+    with tab1:
+        url = st.text_input(
+            "Enter URL",
+            placeholder="https://www.example.com/old-page"
+        )
+
+        if st.button("Check Redirect", key="single_redirect"):
+            if not url.strip():
+                st.warning("Please enter a URL")
+            else:
+                import pandas as pd
+
+                with st.spinner("Following redirects..."):
+                    hops, error = trace_redirects(url.strip(), **options)
+
+                if not hops:
+                    st.error(f"ERROR: {error}")
+                else:
+                    if error:
+                        st.warning(f"⚠️ {error}")
+                    else:
+                        st.success(f"✅ Final status {hops[-1]['Status']} after {len(hops) - 1} hop(s)")
+                    st.dataframe(pd.DataFrame(hops), use_container_width=True)
+
+    # ---------------- TAB 2: Bulk Upload ----------------
+    with tab2:
+        uploaded_file = st.file_uploader(
+            f"Upload Excel/CSV with a '{URL_COLUMN}' column",
+            type=["xlsx", "csv"]
+        )
+
+        url_column = st.text_input("URL column", value=URL_COLUMN, key="redirects_url_column")
+        concurrency = st.number_input(
+            "URLs in flight", min_value=1, max_value=64, value=BULK_CONCURRENCY, key="redirects_concurrency"
+        )
+
+        if uploaded_file and st.button("Run Bulk Check", key="bulk_redirects"):
+            workspace = job_workspace()
+            ext = os.path.splitext(uploaded_file.name)[1].lower()
+            input_file = os.path.join(workspace, f"input{ext}")
+            with open(input_file, "wb") as f:
+                f.write(uploaded_file.getbuffer())
+
+            st.session_state[JOB_KEY] = get_job_manager().submit(
+                "Redirects",
+                run_redirect_audit,
+                workspace=workspace,
+                input_file=input_file,
+                output_file=os.path.join(workspace, OUTPUT_NAME),
+                concurrency=int(concurrency),
+                url_column=url_column.strip() or URL_COLUMN,
+                **options,
+            )
+
+        show_job(JOB_KEY, show_logs=False, download_name=OUTPUT_NAME)
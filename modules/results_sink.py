@@ -0,0 +1,294 @@
+import csv
+import json
+import os
+
+# -------------------------
+# Configuration
+# -------------------------
+
+FLUSH_EVERY = 50           # rows between flushes to disk
+PARQUET_ROW_GROUP = 1000   # rows per Parquet row group
+
+
+# -------------------------
+# Sinks
+# -------------------------
+# Every sink takes result rows (dicts) one at a time and writes them out as
+# it goes, so memory stays flat no matter how many rows a run produces.
+# Columns are fixed by `columns` or by the first row written; keys a later
+# row adds are dropped and missing keys are left empty.
+
+class CsvSink:
+    """Plain CSV, flushed every FLUSH_EVERY rows; readable while the run is going."""
+
+    def __init__(self, path, columns=None, flush_every=FLUSH_EVERY):
+        self.path = path
+        self.columns = list(columns) if columns else None
+        self.flush_every = max(1, flush_every)
+        self.rows = 0
+        self._file = open(path, "w", newline="", encoding="utf-8-sig")
+        self._writer = None
+
+    def write(self, row):
+        if self._writer is None:
+            self.columns = self.columns or list(row)
+            self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+            self._writer.writeheader()
+        self._writer.writerow(row)
+        self.rows += 1
+        if self.rows % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonlSink(CsvSink):
+    """One JSON object per line; keeps every key of every row."""
+
+    def __init__(self, path, columns=None, flush_every=FLUSH_EVERY):
+        self.path = path
+        self.columns = list(columns) if columns else None
+        self.flush_every = max(1, flush_every)
+        self.rows = 0
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, row):
+        self._file.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+        self.rows += 1
+        if self.rows % self.flush_every == 0:
+            self._file.flush()
+
+
+class _PartialMirror:
+    """
+    Formats that are only valid once closed (xlsx, Parquet) mirror their
+    rows into `<path>.partial.csv` so partial results can be read mid-run.
+    The mirror is removed when the sink closes cleanly.
+    """
+
+    def _open_mirror(self, path, columns, partial_path=None):
+        self.partial_path = partial_path or f"{path}.partial.csv"
+        self._mirror = CsvSink(self.partial_path, columns)
+
+    def _close_mirror(self):
+        self._mirror.close()
+        try:
+            os.remove(self.partial_path)
+        except OSError:
+            pass
+
+
+class ExcelSheetSink(_PartialMirror):
+    """
+    One sheet of a write-only workbook (see ExcelSink / ExcelBookSink).
+    `row_fill(row)` may return an openpyxl fill for the whole row.
+    """
+
+    def __init__(self, ws, path, columns=None, row_fill=None, partial_path=None):
+        self.path = path
+        self.columns = list(columns) if columns else None
+        self.row_fill = row_fill
+        self.rows = 0
+        self._ws = ws
+        self._open_mirror(path, columns, partial_path)
+
+    def write(self, row):
+        if self.rows == 0:
+            self.columns = self.columns or list(row)
+            self._ws.append(self.columns)
+        values = [_cell_value(row.get(c)) for c in self.columns]
+        fill = self.row_fill(row) if self.row_fill else None
+        if fill is not None:
+            from openpyxl.cell import WriteOnlyCell
+
+            cells = []
+            for value in values:
+                cell = WriteOnlyCell(self._ws, value=value)
+                cell.fill = fill
+                cells.append(cell)
+            values = cells
+        self._ws.append(values)
+        self._mirror.write(row)
+        self.rows += 1
+
+    def finish(self):
+        """Header for a sheet that got no rows; call before the workbook is saved."""
+        if self.rows == 0 and self.columns:
+            self._ws.append(self.columns)
+
+
+class ExcelBookSink:
+    """
+    Several sheets of one openpyxl write-only workbook, written side by
+    side: sheets = {name: columns} in tab order, and book[name] is a sink
+    for that sheet. Each sheet mirrors to `<path>.<name>.partial.csv`
+    (`<path>.partial.csv` for a single sheet). `row_fills` maps sheet
+    names to a row_fill function (see ExcelSheetSink).
+    """
+
+    def __init__(self, path, sheets, row_fills=None):
+        from openpyxl import Workbook
+
+        self.path = path
+        self._wb = Workbook(write_only=True)
+        self.sheets = {}
+        for name, columns in sheets.items():
+            partial_path = f"{path}.partial.csv" if len(sheets) == 1 else f"{path}.{name}.partial.csv"
+            self.sheets[name] = ExcelSheetSink(
+                self._wb.create_sheet(name[:31]), path, columns,
+                (row_fills or {}).get(name), partial_path,
+            )
+
+    def __getitem__(self, name):
+        return self.sheets[name]
+
+    def close(self):
+        for sheet in self.sheets.values():
+            sheet.finish()
+        self._wb.save(self.path)
+        for sheet in self.sheets.values():
+            sheet._close_mirror()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ExcelSink(ExcelBookSink):
+    """openpyxl write-only workbook: rows are streamed, never held as cells."""
+
+    def __init__(self, path, columns=None, sheet_name="Results"):
+        super().__init__(path, {sheet_name: columns})
+        self._sheet = self.sheets[sheet_name]
+        self.partial_path = self._sheet.partial_path
+
+    @property
+    def rows(self):
+        return self._sheet.rows
+
+    @property
+    def columns(self):
+        return self._sheet.columns
+
+    def write(self, row):
+        self._sheet.write(row)
+
+
+class ParquetSink(_PartialMirror):
+    """
+    Parquet via pyarrow, one row group per PARQUET_ROW_GROUP rows. Every
+    column is stored as a string because result columns mix types (e.g.
+    HTTP Status is a code or "Error").
+    """
+
+    def __init__(self, path, columns=None, row_group=PARQUET_ROW_GROUP):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._pq = pq
+        self.path = path
+        self.columns = list(columns) if columns else None
+        self.row_group = max(1, row_group)
+        self.rows = 0
+        self._buffer = []
+        self._writer = None
+        self._open_mirror(path, columns)
+
+    def write(self, row):
+        self.columns = self.columns or list(row)
+        self._buffer.append(row)
+        self._mirror.write(row)
+        self.rows += 1
+        if len(self._buffer) >= self.row_group:
+            self._flush()
+
+    def _flush(self):
+        if not self.columns:
+            return
+        schema = self._pa.schema([(c, self._pa.string()) for c in self.columns])
+        table = self._pa.Table.from_pydict(
+            {
+                c: [None if r.get(c) is None else str(r.get(c)) for r in self._buffer]
+                for c in self.columns
+            },
+            schema=schema,
+        )
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, schema)
+        self._writer.write_table(table)
+        self._buffer = []
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+        self._close_mirror()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+SINKS = {
+    ".csv": CsvSink,
+    ".jsonl": JsonlSink,
+    ".xlsx": ExcelSink,
+    ".parquet": ParquetSink,
+}
+
+
+def _cell_value(value):
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    if isinstance(value, (dict, list, tuple)):
+        value = json.dumps(value, ensure_ascii=False, default=str)
+    if isinstance(value, str):
+        value = ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def open_sink(path, columns=None):
+    """Sink for `path`, chosen by extension (.xlsx, .csv, .jsonl, .parquet)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SINKS:
+        raise ValueError(f"Unsupported output format '{ext}' (use {', '.join(SINKS)})")
+    return SINKS[ext](path, columns)
+
+
+# -------------------------
+# Ordering
+# -------------------------
+
+def in_input_order(results, start=0):
+    """
+    Take (index, value) pairs in any order (e.g. as futures complete) and
+    yield the values in index order, holding back only the ones that
+    arrived ahead of a slower one.
+    """
+    pending = {}
+    next_index = start
+    for index, value in results:
+        pending[index] = value
+        while next_index in pending:
+            yield pending.pop(next_index)
+            next_index += 1
+
+
+def write_rows(rows, path, columns=None):
+    """Drain an iterable of row dicts into a sink for `path`; returns the row count."""
+    with open_sink(path, columns) as sink:
+        for row in rows:
+            sink.write(row)
+        return sink.rows
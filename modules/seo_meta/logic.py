@@ -1,9 +1,86 @@
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.browser_pool import get_pool
+from modules.page_extract import extract_one
+from modules.static_page import ENGINES, fetch_soup, looks_unrendered
+
+# -------------------------
+# Configuration
+# -------------------------
+
+# <meta> tags and <img alt> are in the server-rendered HTML, so the DOM is
+# enough; use "load" or "networkidle" for sites that inject them with JS.
+WAIT_UNTIL = "domcontentloaded"
+SETTLE_MS = 0              # extra wait after WAIT_UNTIL fires
+PAGE_TIMEOUT_MS = 60000
+BULK_CONCURRENCY = 8       # pages in flight during bulk runs
+
+# "auto": raw HTML over HTTP, rendered in the browser only when that looks
+# incomplete; "static" / "browser" force one engine (see static_page.ENGINES)
+ENGINE = "auto"
+
+WAIT_STRATEGIES = ["domcontentloaded", "load", "networkidle", "commit"]
+
+COLUMNS = [
+    "URL", "Meta Title Present", "Meta Title Text", "Meta Description Present",
+    "Meta Description Text", "Googlebot Tag index,follow", "Googlebot Tag Content",
+    "Missing ALT Image Count", "Missing ALT Image Sources", "Status",
+]
+
+
+# -------------------------
+# Extraction
+# -------------------------
+# Data the checks need: the three meta tags' content (None when the tag is
+# missing) and the src of every <img> without ALT text.
+
+META_JS = """
+() => {
+    const content = (name) => {
+        const meta = document.querySelector(`meta[name="${name}"]`);
+        return meta ? (meta.getAttribute("content") || "") : null;
+    };
+    return {
+        title: content("title"),
+        description: content("description"),
+        googlebot: content("googlebot"),
+        missing_alt: [...document.querySelectorAll("img")]
+            .filter((img) => !(img.getAttribute("alt") || "").trim())
+            .map((img) => img.getAttribute("src") || ""),
+    };
+}
+"""
+
+
+def extract_meta(soup):
+    """The META_JS data, read from a parsed page."""
+
+    def content(name):
+        meta = soup.find("meta", attrs={"name": name})
+        return meta.get("content", "") if meta else None
+
+    return {
+        "title": content("title"),
+        "description": content("description"),
+        "googlebot": content("googlebot"),
+        "missing_alt": [
+            img.get("src", "")
+            for img in soup.find_all("img")
+            if img.get("alt") is None or not img.get("alt").strip()
+        ],
+    }
+
 
+def meta_extractor():
+    return {"js": META_JS, "soup": extract_meta}
 
-def check_meta_tags(page, url):
+
+def meta_from_data(data, url, status="OK"):
+    """
+    Meta title / description / googlebot and image ALT checks on the
+    extracted page data. `data` may be None (page failed to load): every
+    check then reports "N" and `status` carries the error.
+    """
 
     meta_title_present = "N"
     meta_description_present = "N"
@@ -12,48 +89,29 @@ def check_meta_tags(page, url):
     meta_title_text = ""
     meta_description_text = ""
     meta_googlebot_text = ""
-    status = "OK"
 
     missing_alt_images = []
 
-    try:
-        page.goto(url, timeout=60000, wait_until="networkidle")
-        page.wait_for_timeout(500)
-
-        soup = BeautifulSoup(page.content(), "html.parser")
+    if data is not None:
 
         # ✅ Meta Title
-        meta_title = soup.find("meta", attrs={"name": "title"})
-        if meta_title and meta_title.get("content", "").strip():
+        meta_title_text = (data["title"] or "").strip()
+        if meta_title_text:
             meta_title_present = "Y"
-            meta_title_text = meta_title.get("content").strip()
 
         # ✅ Meta Description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content", "").strip():
+        meta_description_text = (data["description"] or "").strip()
+        if meta_description_text:
             meta_description_present = "Y"
-            meta_description_text = meta_desc.get("content").strip()
 
         # ✅ Googlebot Tag
-        meta_googlebot = soup.find("meta", attrs={"name": "googlebot"})
-        if meta_googlebot and meta_googlebot.get("content", "").strip():
-            meta_googlebot_text = meta_googlebot.get("content").strip()
-            content = meta_googlebot_text.lower().replace(" ", "")
-            if "index" in content and "follow" in content:
-                googlebot_index_follow = "Y"
+        meta_googlebot_text = (data["googlebot"] or "").strip()
+        content = meta_googlebot_text.lower().replace(" ", "")
+        if "index" in content and "follow" in content:
+            googlebot_index_follow = "Y"
 
         # ✅ Image ALT Tag Check (Original Style)
-        images = soup.find_all("img")
-
-        for img in images:
-            alt = img.get("alt")
-            src = img.get("src", "")
-
-            if alt is None or not alt.strip():
-                missing_alt_images.append(src)
-
-    except Exception as e:
-        status = f"Error: {e}"
+        missing_alt_images = data["missing_alt"]
 
     return {
         "URL": url,
@@ -67,39 +125,87 @@ def check_meta_tags(page, url):
         "Missing ALT Image Sources": "\n".join(missing_alt_images),
         "Status": status
     }
-def run_single_url(url):
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
 
-        result = check_meta_tags(page, url)
+def analyze_meta_tags(soup, url, status="OK"):
+    """meta_from_data() for a parsed page (None when it failed to load)."""
+    return meta_from_data(extract_meta(soup) if soup is not None else None, url, status)
 
-        browser.close()
 
-    return result
+def meta_error_result(url, error):
+    return analyze_meta_tags(None, url, status=f"Error: {error}")
 
 
-def run_bulk(file):
+async def check_meta_tags(page, url, wait_until=WAIT_UNTIL, settle_ms=SETTLE_MS):
 
-    df_in = pd.read_excel(file)
+    try:
+        await page.goto(url, timeout=PAGE_TIMEOUT_MS, wait_until=wait_until)
+        if settle_ms:
+            await page.wait_for_timeout(settle_ms)
 
-    if "URL" not in df_in.columns:
-        return None, "Excel must contain a column named 'URL'"
+        return meta_from_data(await extract_one(page, meta_extractor()), url)
 
-    results = []
+    except Exception as e:
+        return meta_error_result(url, e)
+
+
+def static_result_incomplete(soup, result):
+    """Raw HTML that is an app shell or carries none of the three meta tags."""
+    return looks_unrendered(soup) or not any(
+        result[key] == "Y"
+        for key in ("Meta Title Present", "Meta Description Present", "Googlebot Tag index,follow")
+    )
+
+
+def check_url(url, engine=ENGINE, wait_until=WAIT_UNTIL, settle_ms=SETTLE_MS):
+    """Meta checks for one URL with the chosen engine (see ENGINE)."""
+    if engine != "browser":
+        soup, error = fetch_soup(url)
+        if engine == "static":
+            return analyze_meta_tags(soup, url) if soup is not None else meta_error_result(url, error)
+        if soup is not None:
+            result = analyze_meta_tags(soup, url)
+            if not static_result_incomplete(soup, result):
+                return result
+
+    return get_pool().run(check_meta_tags, url, wait_until, settle_ms)
+
+
+def run_single_url(url, wait_until=WAIT_UNTIL, engine=ENGINE):
+
+    return check_url(url, engine, wait_until)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
 
-        for url in df_in["URL"].dropna():
-            url = str(url).strip()
-            result = check_meta_tags(page, url)
-            results.append(result)
+def iter_bulk(urls, concurrency=BULK_CONCURRENCY, wait_until=WAIT_UNTIL, settle_ms=SETTLE_MS,
+              engine=ENGINE):
+    """
+    Check every URL with up to `concurrency` in flight (HTTP fetches and/or
+    pages on the shared browser pool, depending on `engine`). Results are
+    yielded in input order, each as soon as it and every URL before it
+    have finished.
+    """
+    pool = get_pool()
+    concurrency = max(1, int(concurrency))
+    if pool.max_pages < concurrency:
+        pool.set_max_pages(concurrency)
 
-        browser.close()
+    def check(url):
+        return check_url(url, engine, wait_until, settle_ms)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        yield from executor.map(check, urls)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def read_url_list(file):
+    """URLs from the "URL" column of an uploaded Excel file."""
+    import pandas as pd
+
+    df_in = pd.read_excel(file)
+
+    if "URL" not in df_in.columns:
+        return None, "Excel must contain a column named 'URL'"
 
-    return pd.DataFrame(results), None
\ No newline at end of file
+    return [str(url).strip() for url in df_in["URL"].dropna()], None
@@ -1,13 +1,26 @@
 import streamlit as st
-import pandas as pd
-import io
-from .logic import run_single_url, run_bulk
+from .logic import (
+    run_single_url,
+    read_url_list,
+    iter_bulk,
+    BULK_CONCURRENCY,
+    COLUMNS,
+    WAIT_STRATEGIES,
+    ENGINES,
+)
+from modules.live_table import LiveTable, download_file, scratch_path
+from modules.results_sink import open_sink
 
 
 def run():
 
     st.title("🔍 SEO Meta Tag Checker")
 
+    engine = st.radio(
+        "Engine", ENGINES, horizontal=True, key="seo_engine",
+        help="auto: raw HTML first, browser render only when it looks incomplete",
+    )
+
     tab1, tab2 = st.tabs(["🔗 Single URL", "📁 Excel Upload"])
 
     # ---------- SINGLE URL ----------
@@ -21,8 +34,9 @@ def run():
                 st.warning("Please enter a valid URL")
             else:
                 with st.spinner("Checking meta tags..."):
-                    result = run_single_url(url.strip())
+                    result = run_single_url(url.strip(), engine=engine)
 
+                import pandas as pd
                 df = pd.DataFrame([result])
 
                 st.success("✅ Completed")
@@ -36,25 +50,31 @@ def run():
             type=["xlsx"]
         )
 
+        col1, col2 = st.columns(2)
+        concurrency = col1.number_input(
+            "Pages in flight", min_value=1, max_value=32, value=BULK_CONCURRENCY, key="seo_concurrency"
+        )
+        wait_until = col2.selectbox(
+            "Wait until", WAIT_STRATEGIES, key="seo_wait_until",
+            help="domcontentloaded is enough for <meta> tags; use networkidle for JS-injected tags",
+        )
+
         if uploaded_file:
 
             if st.button("Run Bulk Check", key="seo_bulk"):
 
-                with st.spinner("Running bulk meta check..."):
-                    df, error = run_bulk(uploaded_file)
+                urls, error = read_url_list(uploaded_file)
 
                 if error:
                     st.error(error)
                 else:
-                    st.success("✅ Bulk Completed")
-                    st.dataframe(df, use_container_width=True)
-
-                    output = io.BytesIO()
-                    df.to_excel(output, index=False)
-
-                    st.download_button(
-                        "⬇ Download Results Excel",
-                        output.getvalue(),
-                        "seo_meta_results.xlsx",
-                        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
\ No newline at end of file
+                    # ✅ Results stream into the table and the workbook in input order
+                    table = LiveTable(len(urls), COLUMNS)
+                    with scratch_path("seo_meta_results.xlsx") as path:
+                        with open_sink(path, COLUMNS) as sink:
+                            for result in iter_bulk(urls, concurrency, wait_until, engine=engine):
+                                sink.write(result)
+                                table.add([result])
+
+                        table.finish("✅ Bulk Completed")
+                        download_file("⬇ Download Results Excel", path)
\ No newline at end of file
@@ -1,46 +1,315 @@
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import asyncio
 
-from modules.badge_caps.logic import run_badge_caps_for_url
-from modules.dummy_links.logic import run_dummy_links_single
-from modules.link_audit.logic import analyze_links
+from modules import http_client
+from modules.browser_pool import get_pool
+from modules.page_extract import extract_page
+from modules.parsing import make_soup
+from modules.results_sink import in_input_order
+from modules.badge_caps.logic import (
+    badge_error_rows, badge_extractor, badges_from_data, find_badges, USER_AGENT,
+    COLUMNS as BADGE_COLUMNS,
+)
+from modules.dummy_links.logic import (
+    dummy_link_extractor, dummy_links_from_data, find_dummy_links, LINK_COLUMNS,
+)
+from modules.link_audit.logic import (
+    audit_links, extract_basic_auth, link_extractor, links_from_data, AUDIT_COLUMNS,
+)
 from modules.form_tester.logic import run_single_url
-from modules.seo_meta.logic import run_single_url as run_seo_meta
+from modules.seo_meta.logic import (
+    analyze_meta_tags, meta_error_result, meta_extractor, meta_from_data,
+    COLUMNS as META_COLUMNS,
+)
 
 
-def run_selected_usecases_parallel(url, selected_usecases):
+# -------------------------
+# Document checkers
+# -------------------------
+# Each checker is a plugin run on the page loaded once by the pipeline:
+#   "extractor" - builds the checker's page extractor (see page_extract);
+#                 all selected extractors run in one page.evaluate
+#   "from_data" - takes (data, url) and returns the same result shape as
+#                 the module's single-URL runner
+#   "analyze"   - takes (soup, url); used for checkers without an
+#                 extractor, which get the DOM parsed once instead
+#   "error"     - builds the result shape for a page that could not be
+#                 loaded
 
-    results = {}
+DOCUMENT_CHECKERS = {
+    "Badge Caps": {
+        "extractor": badge_extractor,
+        "from_data": badges_from_data,
+        "analyze": find_badges,
+        "error": badge_error_rows,
+    },
+    "Dummy Links": {
+        "extractor": dummy_link_extractor,
+        "from_data": dummy_links_from_data,
+        "analyze": find_dummy_links,
+        "error": lambda url, e: f"ERROR: {e}",
+    },
+    "Link Audit": {
+        "extractor": link_extractor,
+        "from_data": links_from_data,
+        "analyze": audit_links,
+        "error": lambda url, e: f"Error fetching page: {e}",
+    },
+    "SEO Meta": {
+        "extractor": meta_extractor,
+        "from_data": meta_from_data,
+        "analyze": analyze_meta_tags,
+        "error": meta_error_result,
+    },
+}
 
-    def run_badge():
-        return run_badge_caps_for_url(url)
 
-    def run_dummy():
-        return run_dummy_links_single(url)
+def register_checker(name, analyze, error, extractor=None, from_data=None):
+    DOCUMENT_CHECKERS[name] = {
+        "extractor": extractor,
+        "from_data": from_data,
+        "analyze": analyze,
+        "error": error,
+    }
+
 
-    def run_audit():
-        audit_result, error = analyze_links(url)
-        return audit_result if not error else error
+async def load_document(page, url, extractors, need_html=False):
+    """
+    Navigate once and read everything the checkers need: one evaluate for
+    all extractors, plus the rendered DOM only if a checker has none.
+    Returns ({name: (data, error)}, html or None).
+    """
+    await page.goto(url, timeout=60000, wait_until="networkidle")
+    await page.wait_for_timeout(500)
+    try:
+        await page.wait_for_selector("a", timeout=10000)
+    except Exception:
+        pass
+    data = await extract_page(page, extractors)
+    html = await page.content() if need_html else None
+    return data, html
 
-    def run_form():
-        return asyncio.run(run_single_url(url))
 
-    task_map = {
-        "Badge Caps": run_badge,
-        "Dummy Links": run_dummy,
-        "Link Audit": run_audit,
-        "Form Tester": run_form,
-        "SEO Meta": lambda: run_seo_meta(url),
+def run_document_checks(url, names):
+    """
+    Load `url` once through the browser pool and run every selected
+    document checker on it.
+    """
+    clean_url, username, password = extract_basic_auth(url)
+    context_options = {"user_agent": USER_AGENT}
+    if username and password:
+        context_options["http_credentials"] = {"username": username, "password": password}
+
+    extractors = {
+        name: DOCUMENT_CHECKERS[name]["extractor"]()
+        for name in names
+        if DOCUMENT_CHECKERS[name].get("extractor")
     }
+    need_html = len(extractors) < len(names)
 
-    with ThreadPoolExecutor(max_workers=len(selected_usecases)) as executor:
-        future_map = {
-            name: executor.submit(task_map[name])
-            for name in selected_usecases
-        }
+    try:
+        data, html = get_pool().run(
+            load_document, clean_url, extractors, need_html, context_options=context_options
+        )
+        soup = make_soup(html) if need_html else None
+    except Exception as e:
+        return {name: DOCUMENT_CHECKERS[name]["error"](url, e) for name in names}
 
-        for name, future in future_map.items():
-            results[name] = future.result()
+    results = {}
+    for name in names:
+        checker = DOCUMENT_CHECKERS[name]
+        try:
+            if name in extractors:
+                value, error = data[name]
+                if error:
+                    raise RuntimeError(error)
+                results[name] = checker["from_data"](value, url)
+            else:
+                results[name] = checker["analyze"](soup, url)
+        except Exception as e:
+            results[name] = checker["error"](url, e)
 
     return results
 
+
+# -------------------------
+# Runner
+# -------------------------
+
+def iter_selected_usecases(url, selected_usecases):
+    """
+    Yield (use case, result) pairs as they finish. All document checks
+    share one page load; the form tester runs alongside on its own page.
+    """
+    document_names = [name for name in selected_usecases if name in DOCUMENT_CHECKERS]
+    run_form = "Form Tester" in selected_usecases
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {}
+        if document_names:
+            futures[executor.submit(run_document_checks, url, document_names)] = "documents"
+        if run_form:
+            futures[executor.submit(asyncio.run, run_single_url(url))] = "Form Tester"
+
+        for future in as_completed(futures):
+            if futures[future] == "documents":
+                for name, result in future.result().items():
+                    yield name, result
+            else:
+                yield "Form Tester", future.result()
+
+
+def run_selected_usecases_parallel(url, selected_usecases):
+
+    results = dict(iter_selected_usecases(url, selected_usecases))
+
+    return {name: results[name] for name in selected_usecases if name in results}
+
+
+# -------------------------
+# Bulk mode
+# -------------------------
+
+PAGES_IN_FLIGHT = 4       # URLs being rendered at once
+HTTP_IN_FLIGHT = 32       # link/static HTTP checks at once, shared by all modules
+
+
+def read_url_list(file):
+    """URLs from the "URL" column of an uploaded .xlsx or .csv file."""
+    import pandas as pd
+
+    name = getattr(file, "name", str(file)).lower()
+    df_in = pd.read_csv(file) if name.endswith(".csv") else pd.read_excel(file)
+
+    if "URL" not in df_in.columns:
+        return None, "File must contain a column named 'URL'"
+
+    urls = [str(u).strip() for u in df_in["URL"].dropna() if str(u).strip()]
+    return urls, None
+
+
+def _summarize_badges(result):
+    if result and str(result[0].get("Status", "OK")).startswith("Error"):
+        return result[0]["Status"]
+    not_caps = sum(1 for r in result if r.get("Badge Text ALL CAPS") == "N")
+    return f"{len(result)} badge(s), {not_caps} not ALL CAPS"
+
+
+def _summarize_dummy_links(result):
+    if isinstance(result, str):
+        return result
+    if not result:
+        return "No dummy links found"
+    return f"{len(result)} dummy link(s)"
+
+
+def _summarize_link_audit(result):
+    if not isinstance(result, list):
+        return str(result)
+    broken = sum(1 for r in result if r["Link Health"] in ("Client Error", "Server Error", "Unreachable"))
+    unexpected = sum(1 for r in result if r["Expected?"] == "✘")
+    return f"{len(result)} links, {broken} broken, {unexpected} unexpected behaviour"
+
+
+def _summarize_seo_meta(result):
+    if result["Status"] != "OK":
+        return result["Status"]
+    return (
+        f"Title {result['Meta Title Present']}, "
+        f"Description {result['Meta Description Present']}, "
+        f"Googlebot {result['Googlebot Tag index,follow']}, "
+        f"{result['Missing ALT Image Count']} missing ALT"
+    )
+
+
+SUMMARIZERS = {
+    "Badge Caps": _summarize_badges,
+    "Dummy Links": _summarize_dummy_links,
+    "Link Audit": _summarize_link_audit,
+    "Form Tester": lambda result: result.get("Result", "ERROR"),
+    "SEO Meta": _summarize_seo_meta,
+}
+
+
+def summarize_results(url, results):
+    """One result-table row per URL: a short verdict per use case."""
+    row = {"URL": url}
+    for name, result in results.items():
+        try:
+            row[name] = SUMMARIZERS[name](result)
+        except Exception as e:
+            row[name] = f"Error: {e}"
+    return row
+
+
+def iter_bulk_usecases(urls, selected_usecases, pages_in_flight=PAGES_IN_FLIGHT,
+                       http_in_flight=HTTP_IN_FLIGHT):
+    """
+    Run every selected use case over `urls`, yielding (index, url, results)
+    as each URL finishes. The page and HTTP budgets are process-wide, so
+    every module draws from the same pool of pages and connections; a run
+    only ever raises them, never lowers them under other running jobs.
+    At most `pages_in_flight` URLs of this run are processed at once.
+    """
+    pages_in_flight = max(1, int(pages_in_flight))
+    pool = get_pool()
+    if pool.max_pages < pages_in_flight:
+        pool.set_max_pages(pages_in_flight)
+    if http_client.http_budget() < int(http_in_flight):
+        http_client.set_http_budget(http_in_flight)
+
+    with ThreadPoolExecutor(max_workers=pages_in_flight) as executor:
+        futures = {
+            executor.submit(run_selected_usecases_parallel, url, selected_usecases): (i, url)
+            for i, url in enumerate(urls)
+        }
+        for future in as_completed(futures):
+            i, url = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                results = {name: f"Error: {e}" for name in selected_usecases}
+            yield i, url, results
+
+
+def iter_bulk_ordered(urls, selected_usecases, pages_in_flight=PAGES_IN_FLIGHT,
+                      http_in_flight=HTTP_IN_FLIGHT):
+    """(url, results) for every URL in input order, each as soon as it is due."""
+    done = iter_bulk_usecases(urls, selected_usecases, pages_in_flight, http_in_flight)
+    return in_input_order((i, (url, results)) for i, url, results in done)
+
+
+def iter_bulk_summaries(urls, selected_usecases, pages_in_flight=PAGES_IN_FLIGHT,
+                        http_in_flight=HTTP_IN_FLIGHT):
+    """Summary rows (see summarize_results) in input order, as soon as each is due."""
+    for url, results in iter_bulk_ordered(urls, selected_usecases, pages_in_flight, http_in_flight):
+        yield summarize_results(url, results)
+
+
+# Detail sheet columns per use case; checkers added with register_checker
+# take theirs from their first row
+DETAIL_COLUMNS = {
+    "Badge Caps": BADGE_COLUMNS,
+    "Dummy Links": LINK_COLUMNS,
+    "Link Audit": ["URL"] + AUDIT_COLUMNS[1:],
+    "Form Tester": ["URL", "Result", "Confirmation", "Form Source", "FormSubmissionId",
+                    "Full URL", "Page ID", "Notes"],
+    "SEO Meta": META_COLUMNS,
+}
+
+
+def detail_columns(name):
+    """Columns of a use case's detail sheet, with room for an error "Result"."""
+    columns = DETAIL_COLUMNS.get(name)
+    if columns and "Result" not in columns:
+        columns = columns + ["Result"]
+    return columns
+
+
+def detail_rows(url, result):
+    """A use case's result for one URL as detail sheet rows, URL first."""
+    if isinstance(result, list):
+        return [{**row, "URL": url} for row in result]
+    if isinstance(result, dict):
+        return [{**result, "URL": url}]
+    return [{"URL": url, "Result": result}]
@@ -1,27 +1,99 @@
 import streamlit as st
-import pandas as pd
-import concurrent.futures
 
-from .logic import run_selected_usecases_parallel
+from .logic import (
+    iter_selected_usecases,
+    iter_bulk_ordered,
+    read_url_list,
+    summarize_results,
+    detail_columns,
+    detail_rows,
+    PAGES_IN_FLIGHT,
+    HTTP_IN_FLIGHT,
+)
+from modules.live_table import LiveTable, download_file, scratch_path
+from modules.results_sink import ExcelBookSink
+
+USE_CASES = [
+    "Badge Caps",
+    "Dummy Links",
+    "Link Audit",
+    "Form Tester",
+    "SEO Meta"
+]
 
 
 def run():
 
     st.title("🚀 Smart Multi-UseCase Runner (Parallel Mode)")
 
-    url = st.text_input("Enter URL")
+    tab1, tab2 = st.tabs(["🔗 Single URL", "📁 Bulk Upload"])
+
+    with tab1:
+        run_single()
+
+    with tab2:
+        run_bulk()
+
+
+def run_bulk():
 
-    selected = st.multiselect(
-        "Select Use Cases",
-        [
-            "Badge Caps",
-            "Dummy Links",
-            "Link Audit",
-            "Form Tester",
-            "SEO Meta"
-        ]
+    uploaded_file = st.file_uploader(
+        "Upload Excel (.xlsx) or CSV with a 'URL' column",
+        type=["xlsx", "csv"],
+        key="smart_bulk_file"
+    )
+
+    selected = st.multiselect("Select Use Cases", USE_CASES, key="smart_bulk_usecases")
+
+    col1, col2 = st.columns(2)
+    pages_in_flight = col1.number_input(
+        "Pages in flight", min_value=1, max_value=16, value=PAGES_IN_FLIGHT
+    )
+    http_in_flight = col2.number_input(
+        "HTTP requests in flight", min_value=1, max_value=128, value=HTTP_IN_FLIGHT
     )
 
+    if st.button("Run Bulk", key="smart_bulk_run"):
+
+        if not uploaded_file:
+            st.warning("Please upload a file")
+            return
+
+        if not selected:
+            st.warning("Select at least one module")
+            return
+
+        urls, error = read_url_list(uploaded_file)
+        if error:
+            st.error(error)
+            return
+
+        # ✅ Rows stream into the table and the workbook (a Summary sheet
+        # plus one detail sheet per use case) in input order
+        summary_columns = ["URL"] + selected
+        table = LiveTable(len(urls), summary_columns, verb="Processed")
+        sheets = {"Summary": summary_columns}
+        sheets.update({name[:31]: detail_columns(name) for name in selected})
+        with scratch_path("smart_runner_bulk_results.xlsx") as path:
+            with ExcelBookSink(path, sheets) as book:
+                for url, results in iter_bulk_ordered(urls, selected, pages_in_flight, http_in_flight):
+                    summary = summarize_results(url, results)
+                    book["Summary"].write(summary)
+                    for name, result in results.items():
+                        for row in detail_rows(url, result):
+                            book[name[:31]].write(row)
+                    table.add([summary])
+
+            table.finish(f"✅ Bulk run complete: {len(urls)} URLs")
+            download_file("⬇ Download Results Excel", path)
+
+
+def run_single():
+
+    url = st.text_input("Enter URL")
+
+    selected = st.multiselect("Select Use Cases", USE_CASES)
+
     if st.button("Run Selected Use Cases"):
 
         if not url.strip():
@@ -48,39 +120,25 @@ def run():
             module_status[module].info(f"{module} ⏳ Running...")
             progress_bars[module] = st.progress(0)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=total_modules) as executor:
+        # ✅ One page load feeds every document check; results stream in
+        for module, result in iter_selected_usecases(url.strip(), selected):
 
-            future_map = {
-                module: executor.submit(
-                    run_selected_usecases_parallel,
-                    url.strip(),
-                    [module]
-                )
-                for module in selected
-            }
+            results[module] = result
 
-            for future in concurrent.futures.as_completed(future_map.values()):
+            completed += 1
+            percentage = completed / total_modules
 
-                for module, f in future_map.items():
-                    if f == future:
+            # ✅ Update module UI
+            progress_bars[module].progress(1.0)
+            module_status[module].success(f"{module} ✅ Completed")
 
-                        result = future.result()
-                        results[module] = result[module]
-
-                        completed += 1
-                        percentage = completed / total_modules
-
-                        # ✅ Update module UI
-                        progress_bars[module].progress(1.0)
-                        module_status[module].success(f"{module} ✅ Completed")
-
-                        # ✅ Update overall progress
-                        overall_progress.progress(percentage)
-
-                        break
+            # ✅ Update overall progress
+            overall_progress.progress(percentage)
 
         st.success("✅ All Selected Modules Executed")
 
+        import pandas as pd
+
         # ✅ Display Results
         for name, result in results.items():
 
@@ -90,7 +148,12 @@ def run():
                 st.dataframe(pd.DataFrame(result), use_container_width=True)
 
             elif name == "Dummy Links":
-                st.text(result)
+                if isinstance(result, str):
+                    st.error(result)
+                elif result:
+                    st.dataframe(pd.DataFrame(result), use_container_width=True)
+                else:
+                    st.info("No dummy links found")
 
             elif name == "Link Audit":
                 if isinstance(result, list):
@@ -0,0 +1,58 @@
+from modules import http_client
+from modules.parsing import make_soup
+
+# -------------------------
+# Configuration
+# -------------------------
+
+STATIC_TIMEOUT = 15        # seconds for the raw HTML request
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Check engines shared by the page checks that can run without a browser:
+#   "static"  - raw server HTML only
+#   "browser" - always render through the browser pool
+#   "auto"    - raw HTML first, render when it looks incomplete
+ENGINES = ["auto", "static", "browser"]
+
+
+# -------------------------
+# Static fetch
+# -------------------------
+
+def fetch_soup(url, user_agent=None, timeout=STATIC_TIMEOUT):
+    """
+    GET `url` through the shared HTTP client and parse it. Returns
+    (soup, None), or (None, error) when the response can't stand in for
+    the rendered page (request failed, non-2xx, not HTML). Credentials
+    embedded in the URL are sent as basic auth.
+    """
+    try:
+        response = http_client.get(
+            url,
+            timeout=timeout,
+            headers={"User-Agent": user_agent or DEFAULT_USER_AGENT},
+        )
+    except Exception as e:
+        return None, str(e)
+
+    if not response.ok:
+        return None, f"HTTP {response.status_code}"
+
+    content_type = response.headers.get("Content-Type", "")
+    if content_type and "html" not in content_type.lower():
+        return None, f"Not an HTML page ({content_type})"
+
+    return make_soup(response.text), None
+
+
+def looks_unrendered(soup):
+    """
+    True when the raw HTML looks like a client-side app shell rather than
+    the page itself: no <head>, or no <meta> tags in it.
+    """
+    return soup is None or soup.head is None or soup.head.find("meta") is None
@@ -0,0 +1,67 @@
+import openpyxl
+
+from modules.form_tester.logic import RunJournal, journal_path, replay_journal
+
+URLS = ["https://www.example.com/a", "https://www.example.com/b", "https://www.example.com/c"]
+
+
+def make_input(tmp_path):
+    wb = openpyxl.Workbook()
+    wb.active.append(["URL", "Result"])
+    for url in URLS:
+        wb.active.append([url, None])
+    path = tmp_path / "input.xlsx"
+    wb.save(path)
+    return str(path)
+
+
+def start_run(input_file, output_file, resume):
+    """What main() does before the workers start (output not saved yet)."""
+    wb = openpyxl.load_workbook(input_file)
+    if resume:
+        replay_journal(wb.active, output_file)
+    return wb, RunJournal(wb, output_file, every_rows=100, append=resume)
+
+
+def finish_row(journal, row, result):
+    journal.sheet.cell(row=row, column=2).value = result
+    journal.record(row)
+
+
+def results(wb):
+    return [wb.active.cell(row=i, column=2).value for i in range(2, len(URLS) + 2)]
+
+
+def test_resume_crash_before_checkpoint_keeps_replayed_rows(tmp_path):
+    input_file = make_input(tmp_path)
+    output_file = str(tmp_path / "output.xlsx")
+
+    # first run: one row done, crash before the first checkpoint
+    _, journal = start_run(input_file, output_file, resume=False)
+    finish_row(journal, 2, "PASS")
+    journal._file.close()
+
+    # resumed run: another row done, crash again before a checkpoint
+    wb, journal = start_run(input_file, output_file, resume=True)
+    assert results(wb) == ["PASS", None, None]
+    finish_row(journal, 3, "FAIL")
+    journal._file.close()
+
+    # second resume still sees both rows
+    wb, journal = start_run(input_file, output_file, resume=True)
+    assert results(wb) == ["PASS", "FAIL", None]
+    journal._file.close()
+
+
+def test_fresh_run_starts_a_new_journal(tmp_path):
+    input_file = make_input(tmp_path)
+    output_file = str(tmp_path / "output.xlsx")
+
+    _, journal = start_run(input_file, output_file, resume=False)
+    finish_row(journal, 2, "PASS")
+    journal._file.close()
+
+    _, journal = start_run(input_file, output_file, resume=False)
+    journal._file.close()
+    with open(journal_path(output_file), encoding="utf-8") as f:
+        assert f.read() == ""
@@ -0,0 +1,28 @@
+from modules.link_cache import LinkStatusCache, normalize_url
+
+MALFORMED = "http://example.com:abc/x"
+
+
+def test_normalize_url_keeps_malformed_port_as_is():
+    assert normalize_url(f" {MALFORMED} ") == MALFORMED
+
+
+def test_normalize_url_drops_default_port_and_fragment():
+    assert normalize_url("HTTPS://WWW.Example.com:443#top") == "https://www.example.com/"
+
+
+def test_cache_accepts_malformed_port():
+    cache = LinkStatusCache(db_path="")
+    assert cache.get(MALFORMED) is None
+    cache.put(MALFORMED, "Error", "Unreachable")
+    assert cache.get(MALFORMED) == ("Error", "Unreachable")
+
+
+def test_malformed_port_link_is_reported_unreachable():
+    from modules.link_audit.logic import links_from_data
+
+    rows = links_from_data(
+        [{"href": MALFORMED, "text": "Bad port", "target": "", "ignored": False}],
+        "https://www.example.com/",
+    )
+    assert [(r["HTTP Status"], r["Link Health"]) for r in rows] == [("Error", "Unreachable")]
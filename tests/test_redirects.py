@@ -0,0 +1,102 @@
+import http.server
+import threading
+
+import pytest
+
+from modules.redirects.logic import check_redirect, summarize_redirect, trace_redirects
+
+AUTH = "Basic dTpw"   # u:p
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    routes = {
+        "/a": "/b",
+        "/b": "/c",
+        "/loop": "/loop",
+        "/loop1": "/loop2",
+        "/loop2": "/loop1",
+        "/nohead": "/c",
+        "/secure/a": "/c",
+        "/locale": "/c",
+    }
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self):
+        path = self.path
+        if path.startswith("/nohead") and self.command == "HEAD":
+            self.send_response(405)
+        elif path.startswith("/secure") and self.headers.get("Authorization") != AUTH:
+            self.send_response(401)
+            self.send_header("WWW-Authenticate", 'Basic realm="dev"')
+        elif path == "/set-cookie":
+            self.send_response(200)
+            self.send_header("Set-Cookie", "locale=fr; Path=/")
+        elif path == "/locale" and "locale=fr" in self.headers.get("Cookie", ""):
+            self.send_response(302)
+            self.send_header("Location", "/fr/")
+        elif path in self.routes:
+            self.send_response(301)
+            self.send_header("Location", self.routes[path])
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_HEAD = do_GET = respond
+
+
+@pytest.fixture(scope="module")
+def base():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_chain_is_followed_to_the_end(base):
+    hops, error = trace_redirects(f"{base}/a")
+    assert error is None
+    assert [hop["Status"] for hop in hops] == [301, 301, 200]
+    row = check_redirect(f"{base}/a")
+    assert row["Hops"] == 2
+    assert summarize_redirect(row) == "301 -> 200 (2 hops)"
+
+
+def test_loop_is_reported(base):
+    hops, error = trace_redirects(f"{base}/loop1")
+    assert error == f"Redirect loop at {base}/loop1"
+    assert len(hops) == 2
+    assert check_redirect(f"{base}/loop1")["Hops"] == 2
+
+
+def test_self_redirect_counts_as_a_hop(base):
+    row = check_redirect(f"{base}/loop")
+    assert row["Hops"] == 1
+    assert row["Final Status Code"] == f"Error: Redirect loop at {base}/loop"
+    assert summarize_redirect(row) == f"301 -> Error: Redirect loop at {base}/loop"
+
+
+def test_head_refused_falls_back_to_get(base):
+    hops, error = trace_redirects(f"{base}/nohead")
+    assert error is None
+    assert [(hop["Status"], hop["Method"]) for hop in hops] == [(301, "GET"), (200, "HEAD")]
+
+
+def test_auth_challenge_retries_with_credentials(base):
+    hops, error = trace_redirects(f"{base}/secure/a", username="u", password="p")
+    assert error is None
+    assert [hop["Status"] for hop in hops] == [301, 200]
+
+
+def test_auth_never_keeps_the_challenge(base):
+    hops, _ = trace_redirects(f"{base}/secure/a", auth_mode="never", username="u", password="p")
+    assert [hop["Status"] for hop in hops] == [401]
+    assert summarize_redirect(check_redirect(f"{base}/secure/a", auth_mode="never")) == "No Redirect (401)"
+
+
+def test_cookies_do_not_carry_over(base):
+    trace_redirects(f"{base}/set-cookie")
+    hops, _ = trace_redirects(f"{base}/locale")
+    assert [hop["Status"] for hop in hops] == [301, 200]